@@ -0,0 +1,150 @@
+"""Flight logger numeric kernels
+
+Per-frame math used by flight_logger.py: unit conversion, heading
+normalization, segment distance and session statistics. All functions take
+and return plain floats/bools so they can be compiled by numba.
+
+- With numba installed, the kernels are JIT-compiled on first use and the
+  machine code is cached next to this file (cache=True).
+- Running this file builds an ahead-of-time extension module with the same
+  name (flight_kernels.pyd / .so) using numba.pycc. Python prefers the
+  extension over this source file, so the logger then starts with no JIT
+  warm-up at all:
+
+      python python/flight_kernels.py
+
+- Without numba, the same functions run as plain Python.
+"""
+
+import math
+import os
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; kernels then run as plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+# Earth radius in nautical miles
+EARTH_RADIUS_NM = 3440.065
+# Segments shorter than this (|dlat| + |dlon|, radians) use the flat-earth approximation
+SHORT_SEGMENT_RAD = 0.01
+
+RAD_TO_DEG = 180 / 3.141592653589793
+M_TO_FT = 3.280839895
+MPS_TO_KT = 1.943844492
+MPS_TO_FPM = 196.8503937
+
+
+@njit(cache=True)
+def normalize_heading(hv):
+    """Convert a raw heading to compass degrees (0°=North, clockwise).
+
+    Detects radians vs degrees: values within ±6.5 are treated as radians.
+    """
+    if abs(hv) <= 6.5:
+        hdg = (hv * RAD_TO_DEG) % 360.0
+    else:
+        hdg = hv % 360.0
+    return (90.0 - hdg) % 360.0
+
+
+@njit(cache=True)
+def convert_row(altitude_m, ias_ms, gs_ms, vs_ms, heading, pitch_rad, bank_rad):
+    """Convert raw simulator values to logger units.
+
+    Returns (altitude_ft, ias_kt, gs_kt, vs_fpm, heading_deg, pitch_deg, bank_deg).
+    """
+    return (
+        altitude_m * M_TO_FT,
+        ias_ms * MPS_TO_KT,
+        gs_ms * MPS_TO_KT,
+        vs_ms * MPS_TO_FPM,
+        normalize_heading(heading),
+        pitch_rad * RAD_TO_DEG,
+        bank_rad * RAD_TO_DEG,
+    )
+
+
+@njit(cache=True)
+def haversine_nm(lat1, lon1, lat2, lon2):
+    """Great-circle distance in nautical miles (radians in)"""
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+    a = (math.sin(dlat/2)**2 +
+         math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2)
+    c = 2 * math.asin(math.sqrt(a))
+
+    return c * EARTH_RADIUS_NM
+
+
+@njit(cache=True)
+def distance_nm(lat1, lon1, lat2, lon2):
+    """Distance in nautical miles between two lat/lon points (degrees in)"""
+    lat1 = math.radians(lat1)
+    lon1 = math.radians(lon1)
+    lat2 = math.radians(lat2)
+    lon2 = math.radians(lon2)
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+
+    # Consecutive samples are a few hundred metres apart; only large jumps
+    # (reposition, antimeridian crossing) need the full haversine formula
+    if abs(dlat) + abs(dlon) > SHORT_SEGMENT_RAD:
+        return haversine_nm(lat1, lon1, lat2, lon2)
+
+    # Equirectangular approximation
+    x = dlon * math.cos(0.5 * (lat1 + lat2))
+    return math.hypot(x, dlat) * EARTH_RADIUS_NM
+
+
+@njit(cache=True)
+def update_stats(alt, spd, lat, lon, plat, plon, maxa, maxs, tot, tko, ldg):
+    """Per-frame statistics kernel.
+
+    plat/plon are NaN when there is no previous fix. Returns
+    (max_altitude, max_speed, total_distance, takeoff_detected, landing_detected).
+    """
+    if alt > maxa:
+        maxa = alt
+    if spd > maxs:
+        maxs = spd
+
+    if not (math.isnan(plat) or math.isnan(plon)):
+        tot += distance_nm(plat, plon, lat, lon)
+
+    # Takeoff: speed > 40 knots and altitude above 100 ft
+    if not tko and spd > 40 and alt > 100:
+        tko = True
+
+    # Landing: was airborne, now slow and low
+    if tko and not ldg and spd < 30 and alt < 200:
+        ldg = True
+
+    return maxa, maxs, tot, tko, ldg
+
+
+def build_aot():
+    """Compile the kernels into a flight_kernels extension module next to this file"""
+    from numba.pycc import CC
+
+    cc = CC('flight_kernels')
+    cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+    cc.export('normalize_heading', 'f8(f8)')(normalize_heading.py_func)
+    cc.export('convert_row', 'UniTuple(f8, 7)(f8, f8, f8, f8, f8, f8, f8)')(convert_row.py_func)
+    cc.export('haversine_nm', 'f8(f8, f8, f8, f8)')(haversine_nm.py_func)
+    cc.export('distance_nm', 'f8(f8, f8, f8, f8)')(distance_nm.py_func)
+    cc.export(
+        'update_stats',
+        'Tuple((f8, f8, f8, b1, b1))(f8, f8, f8, f8, f8, f8, f8, f8, f8, b1, b1)'
+    )(update_stats.py_func)
+
+    cc.compile()
+    print(f"✅ Built AOT kernels in {cc.output_dir}")
+
+
+if __name__ == "__main__":
+    build_aot()
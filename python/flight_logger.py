@@ -5,6 +5,27 @@ import datetime
 import threading
 import time
 import os
+import math
+
+# Numeric kernels: AOT-compiled extension, numba JIT, or plain Python fallback
+from flight_kernels import convert_row, distance_nm, update_stats
+
+# Socket receive tuning for the continuous telemetry stream
+RECV_BUFFER_BYTES = 262144
+# Preallocated receive buffer filled with recv_into() (grows for oversized lines)
+RX_BUFFER_BYTES = 131072
+
+# CSV columns (derived from canonical variables), in parse_flight_data() row order
+CSV_COLUMNS = (
+    'timestamp', 'elapsed_time', 'latitude_deg', 'longitude_deg', 'altitude_ft',
+    'indicated_airspeed_kt', 'ground_speed_kt', 'vertical_speed_fpm',
+    'heading_deg', 'pitch_deg', 'bank_deg',
+    'com1_freq_mhz', 'nav1_freq_mhz'
+)
+
+# Column name -> position in a row tuple
+_FIELD_INDEX = {name: i for i, name in enumerate(CSV_COLUMNS)}
+
 
 class FlightLogger:
     def __init__(self, tcp_host='localhost', tcp_port=12345):
@@ -12,11 +33,16 @@ class FlightLogger:
         self.tcp_port = tcp_port
         self.running = False
         self.socket = None
-        self.current_flight_data = {}
+        self.current_flight_data = None
         self.flight_start_time = None
         self.csv_file = None
         self.csv_writer = None
         
+        # Receive buffer: bytes [0, _rx_len) hold data not yet split into lines
+        self._rx_buf = bytearray(RX_BUFFER_BYTES)
+        self._rx_view = memoryview(self._rx_buf)
+        self._rx_len = 0
+        
         # Flight session tracking
         self.total_distance = 0
         self.max_altitude = 0
@@ -32,6 +58,9 @@ class FlightLogger:
         """Connect to AeroflyBridge TCP server"""
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RECV_BUFFER_BYTES)
+            if hasattr(socket, 'TCP_QUICKACK'):  # Linux only
+                self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
             self.socket.connect((self.tcp_host, self.tcp_port))
             print(f"✅ Connected to AeroflyBridge at {self.tcp_host}:{self.tcp_port}")
             return True
@@ -59,16 +88,8 @@ class FlightLogger:
         
         self.csv_file = open(filepath, 'w', newline='')
         
-        # Define columns to log (derived from canonical variables)
-        fieldnames = [
-            'timestamp', 'elapsed_time', 'latitude_deg', 'longitude_deg', 'altitude_ft',
-            'indicated_airspeed_kt', 'ground_speed_kt', 'vertical_speed_fpm',
-            'heading_deg', 'pitch_deg', 'bank_deg',
-            'com1_freq_mhz', 'nav1_freq_mhz'
-        ]
-        
-        self.csv_writer = csv.DictWriter(self.csv_file, fieldnames=fieldnames)
-        self.csv_writer.writeheader()
+        self.csv_writer = csv.writer(self.csv_file)
+        self.csv_writer.writerow(CSV_COLUMNS)
         
         print(f"📊 Logging to: {filepath}")
         return filepath
@@ -77,102 +98,73 @@ class FlightLogger:
         """Extract relevant data from JSON and update flight statistics"""
         try:
             v = json_data.get('variables', {})
-            M_TO_FT = 3.280839895
-            MPS_TO_KT = 1.943844492
-            RAD_TO_DEG = 180 / 3.141592653589793
-            MPS_TO_FPM = 196.8503937
             
             # Current position and basic data (convert to friendly units)
-            current_data = {
-                'timestamp': datetime.datetime.now().isoformat(),
-                'elapsed_time': self.get_elapsed_time(),
-                'latitude_deg': v.get('Aircraft.Latitude', 0.0),
-                'longitude_deg': v.get('Aircraft.Longitude', 0.0),
-                'altitude_ft': v.get('Aircraft.Altitude', 0.0) * M_TO_FT,
-                'indicated_airspeed_kt': v.get('Aircraft.IndicatedAirspeed', 0.0) * MPS_TO_KT,
-                'ground_speed_kt': v.get('Aircraft.GroundSpeed', 0.0) * MPS_TO_KT,
-                'vertical_speed_fpm': v.get('Aircraft.VerticalSpeed', 0.0) * MPS_TO_FPM,
-                # Heading normalization:
-                # Prefer MagneticHeading; fallback to TrueHeading. Detect radians vs degrees
-                # and convert to compass heading (0°=North, clockwise).
-                **(lambda hv: {
-                    'heading_deg': (
-                        (lambda hdg_deg: hdg_deg if hdg_deg >= 0 else hdg_deg + 360)(
-                            (90.0 - (
-                                ((hv * RAD_TO_DEG) % 360.0) if abs(hv) <= 6.5 else (hv % 360.0)
-                            )) % 360.0
-                        )
-                    )
-                })(
-                    v.get('Aircraft.MagneticHeading', v.get('Aircraft.TrueHeading', 0.0))
-                ),
-                'pitch_deg': v.get('Aircraft.Pitch', 0.0) * RAD_TO_DEG,
-                'bank_deg': v.get('Aircraft.Bank', 0.0) * RAD_TO_DEG,
-                'com1_freq_mhz': v.get('Communication.COM1Frequency', 0.0),
-                'nav1_freq_mhz': v.get('Navigation.NAV1Frequency', 0.0)
-            }
+            lat = v.get('Aircraft.Latitude', 0.0)
+            lon = v.get('Aircraft.Longitude', 0.0)
+            (altitude_ft, ias_kt, ground_speed_kt, vs_fpm,
+             heading_deg, pitch_deg, bank_deg) = convert_row(
+                float(v.get('Aircraft.Altitude', 0.0)),
+                float(v.get('Aircraft.IndicatedAirspeed', 0.0)),
+                float(v.get('Aircraft.GroundSpeed', 0.0)),
+                float(v.get('Aircraft.VerticalSpeed', 0.0)),
+                # Prefer MagneticHeading; fallback to TrueHeading
+                float(v.get('Aircraft.MagneticHeading', v.get('Aircraft.TrueHeading', 0.0))),
+                float(v.get('Aircraft.Pitch', 0.0)),
+                float(v.get('Aircraft.Bank', 0.0)),
+            )
+            
+            # Row tuple in CSV_COLUMNS order
+            row = (
+                datetime.datetime.now().isoformat(),
+                self.get_elapsed_time(),
+                lat,
+                lon,
+                altitude_ft,
+                ias_kt,
+                ground_speed_kt,
+                vs_fpm,
+                heading_deg,
+                pitch_deg,
+                bank_deg,
+                v.get('Communication.COM1Frequency', 0.0),
+                v.get('Navigation.NAV1Frequency', 0.0),
+            )
             
             # Update flight statistics
-            self.update_flight_stats(current_data)
+            self.update_flight_stats(altitude_ft, ground_speed_kt, lat, lon)
             
-            return current_data
+            return row
             
         except Exception as e:
             print(f"❌ Error parsing flight data: {e}")
             return None
 
-    def update_flight_stats(self, data):
+    def update_flight_stats(self, altitude, speed, lat, lon):
         """Update flight session statistics"""
-        altitude = data['altitude_ft']
-        speed = data['ground_speed_kt']
-        lat = data['latitude_deg']
-        lon = data['longitude_deg']
-        
-        # Track maximum values
-        if altitude > self.max_altitude:
-            self.max_altitude = altitude
-        if speed > self.max_speed:
-            self.max_speed = speed
+        was_airborne = self.takeoff_detected
+        was_landed = self.landing_detected
         
-        # Calculate distance traveled
-        if self.prev_lat is not None and self.prev_lon is not None:
-            distance = self.calculate_distance(
-                self.prev_lat, self.prev_lon, lat, lon
-            )
-            self.total_distance += distance
+        (self.max_altitude, self.max_speed, self.total_distance,
+         self.takeoff_detected, self.landing_detected) = update_stats(
+            float(altitude), float(speed), float(lat), float(lon),
+            math.nan if self.prev_lat is None else self.prev_lat,
+            math.nan if self.prev_lon is None else self.prev_lon,
+            float(self.max_altitude), float(self.max_speed), float(self.total_distance),
+            self.takeoff_detected, self.landing_detected,
+        )
         
         self.prev_lat = lat
         self.prev_lon = lon
         
-        # Detect takeoff (speed > 40 knots and altitude increasing)
-        if not self.takeoff_detected and speed > 40 and altitude > 100:
-            self.takeoff_detected = True
+        if self.takeoff_detected and not was_airborne:
             print("🛫 Takeoff detected!")
-        
-        # Detect landing (was airborne, now slow and low)
-        if (self.takeoff_detected and not self.landing_detected and 
-            speed < 30 and altitude < 200):
-            self.landing_detected = True
+        if self.landing_detected and not was_landed:
             print("🛬 Landing detected!")
 
     def calculate_distance(self, lat1, lon1, lat2, lon2):
         """Calculate distance between two lat/lon points in nautical miles"""
-        import math
-        
-        # Convert to radians
-        lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
-        
-        # Haversine formula
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-        a = (math.sin(dlat/2)**2 + 
-             math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2)
-        c = 2 * math.asin(math.sqrt(a))
-        
-        # Earth radius in nautical miles
-        r = 3440.065
-        
-        return c * r
+        return distance_nm(lat1, lon1, lat2, lon2)
 
     def get_elapsed_time(self):
         """Get elapsed time since flight start"""
@@ -194,18 +186,48 @@ class FlightLogger:
         print(f"🏃 Max Speed: {self.max_speed:.0f} kts")
         
         if self.current_flight_data:
-            data = self.current_flight_data
+            row = self.current_flight_data
+            i = _FIELD_INDEX
             print("\n📊 CURRENT STATUS:")
-            print(f"   Position: {data['latitude_deg']:.4f}, {data['longitude_deg']:.4f}")
-            print(f"   Altitude: {data['altitude_ft']:.0f} ft")
-            print(f"   Speed: {data['indicated_airspeed_kt']:.0f} kts IAS / {data['ground_speed_kt']:.0f} kts GS")
-            print(f"   Heading: {data['heading_deg']:.0f}°")
-            print(f"   V/S: {data['vertical_speed_fpm']:.0f} ft/min")
+            print(f"   Position: {row[i['latitude_deg']]:.4f}, {row[i['longitude_deg']]:.4f}")
+            print(f"   Altitude: {row[i['altitude_ft']]:.0f} ft")
+            print(f"   Speed: {row[i['indicated_airspeed_kt']]:.0f} kts IAS / {row[i['ground_speed_kt']]:.0f} kts GS")
+            print(f"   Heading: {row[i['heading_deg']]:.0f}°")
+            print(f"   V/S: {row[i['vertical_speed_fpm']]:.0f} ft/min")
         
         print(f"\n🎯 Status: {'🛫 Airborne' if self.takeoff_detected else '🛬 On Ground'}")
         print("=" * 60)
         print("Press Ctrl+C to stop logging and generate final report")
 
+    def _recv(self):
+        """Receive into the preallocated buffer; returns the byte count (0 = closed)"""
+        if self._rx_len == len(self._rx_buf):
+            # A single line larger than the buffer; grow it
+            self._rx_view.release()
+            self._rx_buf.extend(bytes(len(self._rx_buf)))
+            self._rx_view = memoryview(self._rx_buf)
+        
+        n = self.socket.recv_into(self._rx_view[self._rx_len:])
+        self._rx_len += n
+        return n
+
+    def _iter_lines(self):
+        """Yield complete lines from the receive buffer, then keep the partial tail"""
+        buf = self._rx_buf
+        start = 0
+        while True:
+            nl = buf.find(b'\n', start, self._rx_len)
+            if nl < 0:
+                break
+            yield buf[start:nl]
+            start = nl + 1
+        
+        # Shift the (rare) partial line back to the start of the buffer
+        remaining = self._rx_len - start
+        if remaining and start:
+            buf[:remaining] = bytes(self._rx_view[start:self._rx_len])
+        self._rx_len = remaining
+
     def start_logging(self):
         """Main logging loop"""
         if not self.connect():
@@ -218,32 +240,26 @@ class FlightLogger:
         print("🚀 Flight logging started!")
         print("✈️ Take off in Aerofly FS4 to begin data collection")
         
-        buffer = ""
-        
         try:
             while self.running:
                 # Receive data from TCP socket
-                data = self.socket.recv(4096).decode('utf-8')
-                if not data:
+                if not self._recv():
                     break
                 
-                buffer += data
-                
                 # Process complete JSON messages
-                while '\n' in buffer:
-                    line, buffer = buffer.split('\n', 1)
+                for line in self._iter_lines():
                     if line.strip():
                         try:
                             json_data = json.loads(line)
-                            flight_data = self.parse_flight_data(json_data)
+                            row = self.parse_flight_data(json_data)
                             
-                            if flight_data:
+                            if row:
                                 # Log to CSV
-                                self.csv_writer.writerow(flight_data)
+                                self.csv_writer.writerow(row)
                                 self.csv_file.flush()
                                 
                                 # Update current data for display
-                                self.current_flight_data = flight_data
+                                self.current_flight_data = row
                                 
                                 # Update display every 2 seconds
                                 if int(time.time()) % 2 == 0:
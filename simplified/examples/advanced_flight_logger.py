@@ -33,6 +33,72 @@ import os
 import math
 
 
+# Earth radius in nautical miles
+EARTH_RADIUS_NM = 3440.065
+
+# Segments shorter than this (|dlat| + |dlon|, radians) use the flat-earth
+# approximation; anything larger (reposition, antimeridian) uses haversine
+SHORT_SEGMENT_RAD = 0.01
+
+# Re-evaluate the cached cos(latitude) once the midpoint drifts this far
+COS_LAT_CACHE_TOLERANCE_RAD = 1e-4
+
+# Socket receive tuning for the continuous telemetry stream
+RECV_BUFFER_BYTES = 262144
+# Preallocated receive buffer filled with recv_into() (grows for oversized lines)
+RX_BUFFER_BYTES = 131072
+
+# Frames whose dedup key matches the last written row are skipped, but a row
+# is still written at least this often (seconds) for continuity
+MIN_WRITE_INTERVAL_S = 1.0
+
+# CSV columns, in the order rows are built by parse_flight_data()
+CSV_COLUMNS = (
+    'timestamp',
+    'elapsed_time',
+    'latitude',
+    'longitude',
+    'altitude_ft',
+    'height_agl_ft',
+    'indicated_airspeed_kts',
+    'ground_speed_kts',
+    'vertical_speed_fpm',
+    'magnetic_heading_deg',
+    'true_heading_deg',
+    'pitch_deg',
+    'bank_deg',
+    'mach_number',
+    'angle_of_attack_deg',
+    'on_ground',
+    'gear_position',
+    'flaps_position',
+    'throttle_position',
+    'parking_brake',
+    'engine1_running',
+    'engine2_running',
+    'engine1_throttle',
+    'engine2_throttle',
+    'nav1_freq_mhz',
+    'nav2_freq_mhz',
+    'com1_freq_mhz',
+    'com2_freq_mhz',
+    'autopilot_master',
+    'autopilot_heading_deg',
+    'autopilot_altitude_ft',
+    'aircraft_name',
+    'nearest_airport',
+)
+
+# Column name -> position in a row tuple
+_FIELD_INDEX = {name: i for i, name in enumerate(CSV_COLUMNS)}
+
+
+def _wrap360(x):
+    """Wrap an angle in degrees to [0, 360) using math.fmod (cheaper than float %)."""
+    x = math.fmod(x, 360.0)
+    return x + 360.0 if x < 0 else x
+
+
 class FlightLogger:
     """Advanced flight data logger with statistics and event detection."""
 
@@ -41,11 +107,20 @@ class FlightLogger:
         self.tcp_port = tcp_port
         self.running = False
         self.socket = None
-        self.current_flight_data = {}
+        self.current_flight_data = None
         self.flight_start_time = None
         self.csv_file = None
         self.csv_writer = None
 
+        # Receive buffer: bytes [0, _rx_len) hold data not yet split into lines
+        self._rx_buf = bytearray(RX_BUFFER_BYTES)
+        self._rx_view = memoryview(self._rx_buf)
+        self._rx_len = 0
+
+        # Duplicate-frame suppression for CSV writes
+        self._last_row_key = None
+        self._last_write_time = 0.0
+
         # Flight session tracking
         self.total_distance = 0
         self.max_altitude = 0
@@ -57,10 +132,17 @@ class FlightLogger:
         self.prev_lat = None
         self.prev_lon = None
 
+        # Cached cos(latitude) for the short-segment distance approximation
+        self._cos_lat_ref = None
+        self._cos_lat = 1.0
+
     def connect(self):
         """Connect to AeroflyReader TCP server."""
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RECV_BUFFER_BYTES)
+            if hasattr(socket, 'TCP_QUICKACK'):  # Linux only
+                self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
             self.socket.settimeout(5.0)
             self.socket.connect((self.tcp_host, self.tcp_port))
             self.socket.settimeout(1.0)
@@ -96,45 +178,8 @@ class FlightLogger:
 
         self.csv_file = open(filepath, 'w', newline='', encoding='utf-8')
 
-        # Define columns to log
-        fieldnames = [
-            'timestamp',
-            'elapsed_time',
-            'latitude',
-            'longitude',
-            'altitude_ft',
-            'height_agl_ft',
-            'indicated_airspeed_kts',
-            'ground_speed_kts',
-            'vertical_speed_fpm',
-            'magnetic_heading_deg',
-            'true_heading_deg',
-            'pitch_deg',
-            'bank_deg',
-            'mach_number',
-            'angle_of_attack_deg',
-            'on_ground',
-            'gear_position',
-            'flaps_position',
-            'throttle_position',
-            'parking_brake',
-            'engine1_running',
-            'engine2_running',
-            'engine1_throttle',
-            'engine2_throttle',
-            'nav1_freq_mhz',
-            'nav2_freq_mhz',
-            'com1_freq_mhz',
-            'com2_freq_mhz',
-            'autopilot_master',
-            'autopilot_heading_deg',
-            'autopilot_altitude_ft',
-            'aircraft_name',
-            'nearest_airport'
-        ]
-
-        self.csv_writer = csv.DictWriter(self.csv_file, fieldnames=fieldnames)
-        self.csv_writer.writeheader()
+        self.csv_writer = csv.writer(self.csv_file)
+        self.csv_writer.writerow(CSV_COLUMNS)
 
         print(f"📊 Logging to: {filepath}")
         return filepath
@@ -149,62 +194,61 @@ class FlightLogger:
 
             # Extract data (convert from radians where needed)
             # Longitude needs normalization from 0-360 to -180/+180
+            lat_deg = RAD_TO_DEG * json_data.get('latitude', 0.0)
             lon_deg = RAD_TO_DEG * json_data.get('longitude', 0.0)
             if lon_deg > 180:
                 lon_deg -= 360
-
-            current_data = {
-                'timestamp': datetime.datetime.now().isoformat(),
-                'elapsed_time': self.get_elapsed_time(),
-                'latitude': RAD_TO_DEG * json_data.get('latitude', 0.0),
-                'longitude': lon_deg,
-                'altitude_ft': json_data.get('altitude', 0.0),
-                'height_agl_ft': json_data.get('height', 0.0),
-                'indicated_airspeed_kts': json_data.get('indicated_airspeed', 0.0) * MPS_TO_KT,
-                'ground_speed_kts': json_data.get('ground_speed', 0.0) * MPS_TO_KT,
-                'vertical_speed_fpm': json_data.get('vertical_speed', 0.0) * MPS_TO_FPM,
-                'magnetic_heading_deg': (RAD_TO_DEG * json_data.get('magnetic_heading', 0.0)) % 360,
-                'true_heading_deg': (RAD_TO_DEG * json_data.get('true_heading', 0.0)) % 360,
-                'pitch_deg': RAD_TO_DEG * json_data.get('pitch', 0.0),
-                'bank_deg': RAD_TO_DEG * json_data.get('bank', 0.0),
-                'mach_number': json_data.get('mach_number', 0.0),
-                'angle_of_attack_deg': RAD_TO_DEG * json_data.get('angle_of_attack', 0.0),
-                'on_ground': 1 if json_data.get('on_ground', 0) > 0.5 else 0,
-                'gear_position': json_data.get('gear', 0.0),
-                'flaps_position': json_data.get('flaps', 0.0),
-                'throttle_position': json_data.get('throttle', 0.0),
-                'parking_brake': 1 if json_data.get('parking_brake', 0) > 0.5 else 0,
-                'engine1_running': 1 if json_data.get('engine_running_1', 0) > 0.5 else 0,
-                'engine2_running': 1 if json_data.get('engine_running_2', 0) > 0.5 else 0,
-                'engine1_throttle': json_data.get('engine_throttle_1', 0.0),
-                'engine2_throttle': json_data.get('engine_throttle_2', 0.0),
-                'nav1_freq_mhz': json_data.get('nav1_frequency', 0.0),
-                'nav2_freq_mhz': json_data.get('nav2_frequency', 0.0),
-                'com1_freq_mhz': json_data.get('com1_frequency', 0.0),
-                'com2_freq_mhz': json_data.get('com2_frequency', 0.0),
-                'autopilot_master': 1 if json_data.get('autopilot_master', 0) > 0.5 else 0,
-                'autopilot_heading_deg': (RAD_TO_DEG * json_data.get('autopilot_heading', 0.0)) % 360,
-                'autopilot_altitude_ft': json_data.get('autopilot_altitude', 0.0),
-                'aircraft_name': json_data.get('aircraft_name', 'Unknown'),
-                'nearest_airport': json_data.get('nearest_airport_id', '----')
-            }
+            altitude_ft = json_data.get('altitude', 0.0)
+            ground_speed_kts = json_data.get('ground_speed', 0.0) * MPS_TO_KT
+
+            # Row tuple in CSV_COLUMNS order
+            row = (
+                datetime.datetime.now().isoformat(),
+                self.get_elapsed_time(),
+                lat_deg,
+                lon_deg,
+                altitude_ft,
+                json_data.get('height', 0.0),
+                json_data.get('indicated_airspeed', 0.0) * MPS_TO_KT,
+                ground_speed_kts,
+                json_data.get('vertical_speed', 0.0) * MPS_TO_FPM,
+                _wrap360(RAD_TO_DEG * json_data.get('magnetic_heading', 0.0)),
+                _wrap360(RAD_TO_DEG * json_data.get('true_heading', 0.0)),
+                RAD_TO_DEG * json_data.get('pitch', 0.0),
+                RAD_TO_DEG * json_data.get('bank', 0.0),
+                json_data.get('mach_number', 0.0),
+                RAD_TO_DEG * json_data.get('angle_of_attack', 0.0),
+                1 if json_data.get('on_ground', 0) > 0.5 else 0,
+                json_data.get('gear', 0.0),
+                json_data.get('flaps', 0.0),
+                json_data.get('throttle', 0.0),
+                1 if json_data.get('parking_brake', 0) > 0.5 else 0,
+                1 if json_data.get('engine_running_1', 0) > 0.5 else 0,
+                1 if json_data.get('engine_running_2', 0) > 0.5 else 0,
+                json_data.get('engine_throttle_1', 0.0),
+                json_data.get('engine_throttle_2', 0.0),
+                json_data.get('nav1_frequency', 0.0),
+                json_data.get('nav2_frequency', 0.0),
+                json_data.get('com1_frequency', 0.0),
+                json_data.get('com2_frequency', 0.0),
+                1 if json_data.get('autopilot_master', 0) > 0.5 else 0,
+                _wrap360(RAD_TO_DEG * json_data.get('autopilot_heading', 0.0)),
+                json_data.get('autopilot_altitude', 0.0),
+                json_data.get('aircraft_name', 'Unknown'),
+                json_data.get('nearest_airport_id', '----'),
+            )
 
             # Update flight statistics
-            self.update_flight_stats(current_data)
+            self.update_flight_stats(altitude_ft, ground_speed_kts, lat_deg, lon_deg)
 
-            return current_data
+            return row
 
         except Exception as e:
             print(f"❌ Error parsing flight data: {e}")
             return None
 
-    def update_flight_stats(self, data):
+    def update_flight_stats(self, altitude, speed, lat, lon):
         """Update flight session statistics."""
-        altitude = data['altitude_ft']
-        speed = data['ground_speed_kts']
-        lat = data['latitude']
-        lon = data['longitude']
-
         # Track maximum values
         if altitude > self.max_altitude:
             self.max_altitude = altitude
@@ -240,17 +284,50 @@ class FlightLogger:
         lat2_rad = math.radians(lat2)
         lon2_rad = math.radians(lon2)
 
-        # Haversine formula
-        dlat = lat2_rad - lat1_rad
-        dlon = lon2_rad - lon1_rad
+        # Consecutive samples are a few hundred metres apart, where the
+        # equirectangular projection is accurate to well under 0.1%
+        if abs(lat2_rad - lat1_rad) + abs(lon2_rad - lon1_rad) > SHORT_SEGMENT_RAD:
+            return self._haversine_distance(lat1_rad, lon1_rad, lat2_rad, lon2_rad)
+        return self._small_seg_distance(lat1_rad, lon1_rad, lat2_rad, lon2_rad)
+
+    def _small_seg_distance(self, lat1, lon1, lat2, lon2):
+        """Equirectangular distance in nautical miles (inputs in radians)."""
+        mid_lat = 0.5 * (lat1 + lat2)
+        if (self._cos_lat_ref is None or
+                abs(mid_lat - self._cos_lat_ref) > COS_LAT_CACHE_TOLERANCE_RAD):
+            self._cos_lat_ref = mid_lat
+            self._cos_lat = math.cos(mid_lat)
+
+        x = (lon2 - lon1) * self._cos_lat
+        y = lat2 - lat1
+        return math.hypot(x, y) * EARTH_RADIUS_NM
+
+    @staticmethod
+    def _haversine_distance(lat1, lon1, lat2, lon2):
+        """Great-circle distance in nautical miles (inputs in radians)."""
+        dlat = lat2 - lat1
+        dlon = lon2 - lon1
         a = (math.sin(dlat / 2) ** 2 +
-             math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2) ** 2)
+             math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2)
         c = 2 * math.asin(math.sqrt(a))
 
-        # Earth radius in nautical miles
-        r = 3440.065
-
-        return c * r
+        return c * EARTH_RADIUS_NM
+
+    def _should_write(self, row, now):
+        """Return False for frames that repeat the last written row (e.g. idle on ground)."""
+        i = _FIELD_INDEX
+        key = (
+            round(row[i['altitude_ft']]),
+            round(row[i['ground_speed_kts']]),
+            round(row[i['latitude']], 5),
+            round(row[i['longitude']], 5),
+            row[i['on_ground']],
+        )
+        if key == self._last_row_key and now - self._last_write_time < MIN_WRITE_INTERVAL_S:
+            return False
+        self._last_row_key = key
+        self._last_write_time = now
+        return True
 
     def get_elapsed_time(self):
         """Get elapsed time since flight start."""
@@ -272,21 +349,51 @@ class FlightLogger:
         print(f"🏃 Max Speed: {self.max_speed:.0f} kts")
 
         if self.current_flight_data:
-            data = self.current_flight_data
+            row = self.current_flight_data
+            i = _FIELD_INDEX
             print("\n📊 CURRENT STATUS:")
-            print(f"   Aircraft: {data['aircraft_name']}")
-            print(f"   Position: {data['latitude']:.6f}, {data['longitude']:.6f}")
-            print(f"   Altitude: {data['altitude_ft']:.0f} ft MSL / {data['height_agl_ft']:.0f} ft AGL")
-            print(f"   Speed: {data['indicated_airspeed_kts']:.0f} kts IAS / {data['ground_speed_kts']:.0f} kts GS")
-            print(f"   Heading: {data['magnetic_heading_deg']:.0f}° (mag) / {data['true_heading_deg']:.0f}° (true)")
-            print(f"   V/S: {data['vertical_speed_fpm']:+.0f} ft/min")
-            print(f"   Pitch/Bank: {data['pitch_deg']:+.1f}° / {data['bank_deg']:+.1f}°")
-            print(f"   Nearest: {data['nearest_airport']}")
+            print(f"   Aircraft: {row[i['aircraft_name']]}")
+            print(f"   Position: {row[i['latitude']]:.6f}, {row[i['longitude']]:.6f}")
+            print(f"   Altitude: {row[i['altitude_ft']]:.0f} ft MSL / {row[i['height_agl_ft']]:.0f} ft AGL")
+            print(f"   Speed: {row[i['indicated_airspeed_kts']]:.0f} kts IAS / {row[i['ground_speed_kts']]:.0f} kts GS")
+            print(f"   Heading: {row[i['magnetic_heading_deg']]:.0f}° (mag) / {row[i['true_heading_deg']]:.0f}° (true)")
+            print(f"   V/S: {row[i['vertical_speed_fpm']]:+.0f} ft/min")
+            print(f"   Pitch/Bank: {row[i['pitch_deg']]:+.1f}° / {row[i['bank_deg']]:+.1f}°")
+            print(f"   Nearest: {row[i['nearest_airport']]}")
 
         print(f"\n🎯 Status: {'🛫 Airborne' if self.takeoff_detected else '🛬 On Ground'}")
         print("=" * 60)
         print("Press Ctrl+C to stop logging and generate final report")
 
+    def _recv(self):
+        """Receive into the preallocated buffer; returns the byte count (0 = closed)."""
+        if self._rx_len == len(self._rx_buf):
+            # A single line larger than the buffer; grow it
+            self._rx_view.release()
+            self._rx_buf.extend(bytes(len(self._rx_buf)))
+            self._rx_view = memoryview(self._rx_buf)
+
+        n = self.socket.recv_into(self._rx_view[self._rx_len:])
+        self._rx_len += n
+        return n
+
+    def _iter_lines(self):
+        """Yield complete lines from the receive buffer, then keep the partial tail."""
+        buf = self._rx_buf
+        start = 0
+        while True:
+            nl = buf.find(b'\n', start, self._rx_len)
+            if nl < 0:
+                break
+            yield buf[start:nl]
+            start = nl + 1
+
+        # Shift the (rare) partial line back to the start of the buffer
+        remaining = self._rx_len - start
+        if remaining and start:
+            buf[:remaining] = bytes(self._rx_view[start:self._rx_len])
+        self._rx_len = remaining
+
     def start_logging(self):
         """Main logging loop."""
         if not self.connect():
@@ -299,43 +406,41 @@ class FlightLogger:
         print("🚀 Flight logging started!")
         print("✈️ Take off in Aerofly FS4 to begin data collection")
 
-        buffer = ""
         last_display_update = 0
 
         try:
             while self.running:
                 # Receive data from TCP socket
                 try:
-                    data = self.socket.recv(16384).decode('utf-8')
+                    received = self._recv()
                 except socket.timeout:
                     continue
 
-                if not data:
+                if not received:
                     print("Connection closed by server")
                     break
 
-                buffer += data
-
                 # Process complete JSON messages
-                while '\n' in buffer:
-                    line, buffer = buffer.split('\n', 1)
+                for line in self._iter_lines():
                     if not line.strip():
                         continue
 
                     try:
                         json_data = json.loads(line)
-                        flight_data = self.parse_flight_data(json_data)
+                        row = self.parse_flight_data(json_data)
 
-                        if flight_data:
-                            # Log to CSV
-                            self.csv_writer.writerow(flight_data)
-                            self.csv_file.flush()
+                        if row:
+                            current_time = time.time()
+
+                            # Log to CSV, skipping frames identical to the last written row
+                            if self._should_write(row, current_time):
+                                self.csv_writer.writerow(row)
+                                self.csv_file.flush()
 
                             # Update current data for display
-                            self.current_flight_data = flight_data
+                            self.current_flight_data = row
 
                             # Update display every 1 second
-                            current_time = time.time()
                             if current_time - last_display_update >= 1.0:
                                 self.print_flight_summary()
                                 last_display_update = current_time
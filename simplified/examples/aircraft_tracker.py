@@ -22,10 +22,14 @@ Usage:
 """
 
 import json
+import math
+import multiprocessing
+import selectors
 import socket
-import threading
+import struct
 import time
 from dataclasses import dataclass
+from multiprocessing import shared_memory
 from typing import Optional, Dict, Any, Tuple, List
 
 import tkinter as tk
@@ -33,6 +37,36 @@ from tkinter import font as tkfont
 from tkintermapview import TkinterMapView
 from PIL import Image, ImageTk, ImageDraw
 
+# Fastest available JSON parser; all of them accept bytes and raise ValueError
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    try:
+        import ujson
+        json_loads = ujson.loads
+    except ImportError:
+        json_loads = json.loads
+
+# With msgspec, decode only the fields the tracker uses and skip the rest in C
+try:
+    import msgspec
+
+    class _TrackerTelemetry(msgspec.Struct):
+        """Subset of the stream JSON read by DataReceiver."""
+        latitude: float = 0.0
+        longitude: float = 0.0
+        altitude: float = 0.0
+        ground_speed: float = 0.0
+        magnetic_heading: Optional[float] = None
+        true_heading: float = 0.0
+        pitch: float = 0.0
+        bank: float = 0.0
+
+    _telemetry_decoder = msgspec.json.Decoder(_TrackerTelemetry)
+except ImportError:
+    msgspec = None
+    _telemetry_decoder = None
 
 # Constants
 TCP_HOST = "localhost"
@@ -43,6 +77,16 @@ CONTROL_FRAME_WIDTH = 200
 INFO_DISPLAY_SIZE: Tuple[int, int] = (24, 9)
 UPDATE_INTERVAL_MS = 100  # GUI refresh interval
 RECEIVE_TIMEOUT_S = 5.0   # Connection considered lost beyond this
+ICON_ROTATION_STEP_DEG = 2  # Heading resolution of cached rotated icons
+EXTRAPOLATE_MAX_S = 2.0   # Dead-reckon the marker at most this long after a sample
+EARTH_RADIUS_M = 6371000.0
+RX_BUFFER_BYTES = 65536   # Preallocated receive buffer (grows for oversized lines)
+MAP_PAN_MIN_PX = 1.0      # Skip map re-centering for smaller on-screen moves
+TILE_SIZE_PX = 256        # Web Mercator tile size used by tkintermapview
+
+# Unit conversions
+RAD_TO_DEG = 180.0 / math.pi
+MPS_TO_KT = 1.943844492
 
 
 @dataclass
@@ -55,128 +99,258 @@ class FlightData:
     heading_rad: float
     pitch_rad: float
     bank_rad: float
+    true_heading_rad: float  # Direction of travel for dead reckoning
 
 
-class DataReceiver:
-    """Receives telemetry from AeroflyReader TCP JSON stream (port 12345)."""
+# Shared-memory layout written by the receiver process: a sequence counter
+# (odd while a write is in progress) followed by longitude, latitude,
+# altitude_ft, ground_speed_ms, heading_rad, pitch_rad, bank_rad,
+# true_heading_rad and the receive timestamp
+_SEQ = struct.Struct("<Q")
+_PAYLOAD = struct.Struct("<9d")
+_STATE_SIZE = _SEQ.size + _PAYLOAD.size
 
-    def __init__(self, host: str = TCP_HOST, port: int = TCP_PORT) -> None:
+
+class _StreamReceiver:
+    """Reads the TCP JSON stream inside the receiver process and publishes to shared memory."""
+
+    def __init__(self, host: str, port: int, state_buf: memoryview) -> None:
         self.host = host
         self.port = port
         self.socket: Optional[socket.socket] = None
-        self.latest_data: Optional[FlightData] = None
-        self.running: bool = False
-        self.receive_thread: Optional[threading.Thread] = None
-        self.last_receive_time: float = 0.0
-
-    def start_receiving(self) -> None:
-        """Start the background receiver thread."""
-        self.running = True
-        self.receive_thread = threading.Thread(target=self._receive_loop, daemon=True)
-        self.receive_thread.start()
+        self._selector = selectors.DefaultSelector()
+        self._state_buf = state_buf
+        self._seq = 0
+
+        # Receive buffer: bytes [0, _rx_len) hold data not yet split into lines
+        self._rx_buf = bytearray(RX_BUFFER_BYTES)
+        self._rx_view = memoryview(self._rx_buf)
+        self._rx_len = 0
+
+    def _close_socket(self) -> None:
+        """Unregister and close the current socket, if any."""
+        if not self.socket:
+            return
+        try:
+            self._selector.unregister(self.socket)
+        except (KeyError, ValueError):
+            pass
+        try:
+            self.socket.close()
+        except Exception:
+            pass
+        self.socket = None
 
     def _connect(self) -> None:
         """Connect or reconnect to the TCP server."""
-        if self.socket:
-            try:
-                self.socket.close()
-            except Exception:
-                pass
+        self._close_socket()
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         sock.settimeout(5.0)
         sock.connect((self.host, self.port))
-        sock.settimeout(1.0)
+        # Non-blocking: the selector tells us when data is ready
+        sock.setblocking(False)
+        self._selector.register(sock, selectors.EVENT_READ)
         self.socket = sock
 
-    def _receive_loop(self) -> None:
-        """Main receive loop running in background thread."""
-        buffer = ""
-        while self.running:
+    def _recv(self) -> int:
+        """Receive into the preallocated buffer; returns the byte count (0 = closed)."""
+        if self._rx_len == len(self._rx_buf):
+            # A single line larger than the buffer; grow it
+            self._rx_view.release()
+            self._rx_buf.extend(bytes(len(self._rx_buf)))
+            self._rx_view = memoryview(self._rx_buf)
+
+        n = self.socket.recv_into(self._rx_view[self._rx_len:])
+        self._rx_len += n
+        return n
+
+    def _process_buffered_lines(self) -> None:
+        """Process complete lines in the receive buffer, then keep the partial tail."""
+        buf = self._rx_buf
+        start = 0
+        try:
+            while True:
+                nl = buf.find(b"\n", start, self._rx_len)
+                if nl < 0:
+                    break
+                line = bytes(self._rx_view[start:nl])
+                start = nl + 1
+                if line.strip():
+                    self._process_line(line)
+        finally:
+            # Shift the partial line back to the start of the buffer; lines
+            # already handed to _process_line are consumed even if it raised
+            remaining = self._rx_len - start
+            if remaining and start:
+                buf[:remaining] = bytes(self._rx_view[start:self._rx_len])
+            self._rx_len = remaining
+
+    def run(self, stop_event) -> None:
+        """Main receive loop; runs until stop_event is set."""
+        while not stop_event.is_set():
             try:
                 if not self.socket:
                     self._connect()
+                    self._rx_len = 0
+
+                # Sleep until the socket is readable instead of polling on a timeout
+                if not self._selector.select(timeout=RECEIVE_TIMEOUT_S):
+                    continue
 
-                data = self.socket.recv(16384).decode("utf-8")
-                if not data:
+                # Drain everything currently queued on the socket
+                closed = False
+                while True:
+                    try:
+                        n = self._recv()
+                    except BlockingIOError:
+                        break
+                    if not n:
+                        closed = True
+                        break
+                    self._process_buffered_lines()
+
+                if closed:
                     # Connection closed by peer; reconnect
                     time.sleep(0.5)
                     self._connect()
-                    continue
-
-                buffer += data
-                while "\n" in buffer:
-                    line, buffer = buffer.split("\n", 1)
-                    if not line.strip():
-                        continue
-                    self._process_line(line)
+                    self._rx_len = 0
 
             except (socket.timeout, TimeoutError):
                 continue
             except (ConnectionResetError, ConnectionAbortedError, OSError) as e:
                 print(f"DataReceiver reconnecting: {e}")
-                try:
-                    if self.socket:
-                        self.socket.close()
-                except Exception:
-                    pass
-                self.socket = None
+                self._close_socket()
                 time.sleep(1.0)
             except Exception as e:
                 print(f"DataReceiver error: {e}")
                 time.sleep(1.0)
+        self._close_socket()
 
-    def _process_line(self, line: str) -> None:
+    def _process_line(self, line: bytes) -> None:
         """Process a single JSON line from the stream."""
-        try:
-            data = json.loads(line)
-        except json.JSONDecodeError:
-            return
+        if _telemetry_decoder is not None:
+            try:
+                t = _telemetry_decoder.decode(line)
+            except msgspec.DecodeError:
+                return
+            lat_rad = t.latitude
+            lon_rad = t.longitude
+            alt_ft = t.altitude
+            gs_ms = t.ground_speed
+            # Use magnetic heading if available, fallback to true heading
+            true_heading_rad = t.true_heading
+            heading_rad = t.magnetic_heading if t.magnetic_heading is not None else true_heading_rad
+            pitch_rad = t.pitch
+            bank_rad = t.bank
+        else:
+            try:
+                data = json_loads(line)
+                lat_rad = float(data.get("latitude", 0.0))
+                lon_rad = float(data.get("longitude", 0.0))
+                alt_ft = float(data.get("altitude", 0.0))
+                gs_ms = float(data.get("ground_speed", 0.0))
+                # Use magnetic heading if available, fallback to true heading
+                true_heading_rad = float(data.get("true_heading", 0.0))
+                heading_rad = float(data.get("magnetic_heading", true_heading_rad))
+                pitch_rad = float(data.get("pitch", 0.0))
+                bank_rad = float(data.get("bank", 0.0))
+            except (ValueError, TypeError, AttributeError):
+                # Malformed line (bad JSON, not an object, null field): drop it
+                return
 
-        # Extract data from the simplified JSON format
         # Note: latitude/longitude come from sim in radians, convert to degrees
         # Longitude needs normalization from 0-360 to -180/+180
-        import math
-        lat = math.degrees(float(data.get("latitude", 0.0)))
-        lon = math.degrees(float(data.get("longitude", 0.0)))
-        if lon > 180:
-            lon -= 360
-        alt_ft = float(data.get("altitude", 0.0))
-        gs_ms = float(data.get("ground_speed", 0.0))
-
-        # Heading is in radians in simplified format
-        # Use magnetic heading if available, fallback to true heading
-        heading_rad = float(data.get("magnetic_heading", data.get("true_heading", 0.0)))
-        pitch_rad = float(data.get("pitch", 0.0))
-        bank_rad = float(data.get("bank", 0.0))
-
-        self.latest_data = FlightData(
-            longitude=lon,
-            latitude=lat,
-            altitude_ft=alt_ft,
-            ground_speed_ms=gs_ms,
-            heading_rad=heading_rad,
-            pitch_rad=pitch_rad,
-            bank_rad=bank_rad,
+        # Heading, pitch and bank stay in radians in FlightData
+        lat = lat_rad * RAD_TO_DEG
+        lon = ((lon_rad * RAD_TO_DEG + 180.0) % 360.0) - 180.0
+
+        # Publish: odd sequence while writing, even once the payload is complete
+        buf = self._state_buf
+        self._seq += 1
+        _SEQ.pack_into(buf, 0, self._seq)
+        _PAYLOAD.pack_into(
+            buf, _SEQ.size,
+            lon, lat, alt_ft, gs_ms, heading_rad, pitch_rad, bank_rad, true_heading_rad,
+            time.time(),
         )
-        self.last_receive_time = time.time()
+        self._seq += 1
+        _SEQ.pack_into(buf, 0, self._seq)
+
+
+def _receiver_main(host: str, port: int, shm_name: str, stop_event) -> None:
+    """Entry point of the receiver process."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        _StreamReceiver(host, port, shm.buf).run(stop_event)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        shm.close()
+
+
+class DataReceiver:
+    """Receives telemetry from AeroflyReader TCP JSON stream (port 12345).
+
+    The socket is read in a separate process so JSON decoding never competes
+    with the Tk main loop for the GIL; the latest state is shared through a
+    small shared-memory block.
+    """
+
+    def __init__(self, host: str = TCP_HOST, port: int = TCP_PORT) -> None:
+        self.host = host
+        self.port = port
+        self.receive_process: Optional[multiprocessing.Process] = None
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._stop_event = None
+
+    def start_receiving(self) -> None:
+        """Start the background receiver process."""
+        self._shm = shared_memory.SharedMemory(create=True, size=_STATE_SIZE)
+        self._shm.buf[:_STATE_SIZE] = bytes(_STATE_SIZE)
+        self._stop_event = multiprocessing.Event()
+        self.receive_process = multiprocessing.Process(
+            target=_receiver_main,
+            args=(self.host, self.port, self._shm.name, self._stop_event),
+            daemon=True,
+        )
+        self.receive_process.start()
+
+    def _read_state(self) -> Optional[Tuple[float, ...]]:
+        """Read a consistent payload from shared memory (None before the first frame)."""
+        buf = self._shm.buf
+        while True:
+            (seq,) = _SEQ.unpack_from(buf, 0)
+            if seq == 0:
+                return None
+            if seq & 1:
+                continue
+            values = _PAYLOAD.unpack_from(buf, _SEQ.size)
+            if _SEQ.unpack_from(buf, 0)[0] == seq:
+                return values
 
     def get_latest_data(self) -> Dict[str, Any]:
         """Get the latest received data and connection status."""
+        state = self._read_state() if self._shm else None
+        if state is None:
+            return {"data": None, "connected": False, "timestamp": 0.0}
         return {
-            "data": self.latest_data,
-            "connected": (time.time() - self.last_receive_time) < RECEIVE_TIMEOUT_S,
+            "data": FlightData(*state[:8]),
+            "connected": (time.time() - state[8]) < RECEIVE_TIMEOUT_S,
+            "timestamp": state[8],
         }
 
     def stop(self) -> None:
-        """Stop the receiver and close connection."""
-        self.running = False
-        if self.receive_thread:
-            self.receive_thread.join(timeout=1.5)
-        if self.socket:
-            try:
-                self.socket.close()
-            except Exception:
-                pass
+        """Stop the receiver process and release shared memory."""
+        if self.receive_process:
+            self._stop_event.set()
+            self.receive_process.join(timeout=1.5)
+            if self.receive_process.is_alive():
+                self.receive_process.terminate()
+            self.receive_process = None
+        if self._shm:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
 
 
 class AircraftTrackerApp:
@@ -256,6 +430,7 @@ class AircraftTrackerApp:
             font=info_font,
         )
         self.info_display.pack(padx=10, pady=10)
+        self._last_info_text = ""
 
     def _setup_aircraft_marker(self) -> None:
         """Setup the aircraft marker icon."""
@@ -264,8 +439,13 @@ class AircraftTrackerApp:
         except Exception:
             self.aircraft_image = self._generate_default_icon(32, 32)
         self.rotated_image = ImageTk.PhotoImage(self.aircraft_image)
+        # Rotated icons keyed by heading bucket (at most 360 / ICON_ROTATION_STEP_DEG)
+        self._icon_cache: Dict[int, ImageTk.PhotoImage] = {}
         self.aircraft_marker = None
         self.initial_position_set = False
+        self._last_drawn_time = 0.0
+        self._last_set_lat: Optional[float] = None
+        self._last_set_lon: Optional[float] = None
 
     def _update_aircraft_position(self) -> None:
         """Periodic update of aircraft position and info display."""
@@ -273,9 +453,16 @@ class AircraftTrackerApp:
 
         if state["connected"]:
             self.connection_status.config(text="Connected", fg="green")
-            if state["data"]:
-                self._update_map_and_marker(state["data"])
-                self._update_info_display(state["data"])
+            data = state["data"]
+            if data:
+                if state["timestamp"] != self._last_drawn_time:
+                    # New sample: full redraw
+                    self._last_drawn_time = state["timestamp"]
+                    self._update_map_and_marker(data)
+                    self._update_info_display(data)
+                else:
+                    # No new sample: only dead-reckon the marker
+                    self._extrapolate_marker(data, time.time() - self._last_drawn_time)
         else:
             self.connection_status.config(text="Disconnected", fg="red")
             self._clear_info_display()
@@ -284,44 +471,70 @@ class AircraftTrackerApp:
 
     def _clear_info_display(self) -> None:
         """Clear the info display when disconnected."""
-        self.info_display.delete(1.0, tk.END)
-        self.info_display.insert(tk.END, "Waiting for data...")
+        self._set_info_text("Waiting for data...")
 
     def _update_map_and_marker(self, data: FlightData) -> None:
         """Update map position and aircraft marker."""
-        import math
-
         if not self.initial_position_set:
             self.map_widget.set_position(data.latitude, data.longitude)
             self.map_widget.set_zoom(10)
             self.initial_position_set = True
 
         # Convert heading from radians to degrees for rotation
-        heading_deg = math.degrees(data.heading_rad) % 360
-        self.rotated_image = self._rotate_image(heading_deg)
-
-        if self.aircraft_marker:
-            self.aircraft_marker.delete()
+        heading_deg = (data.heading_rad * RAD_TO_DEG) % 360
+        rotated_image = self._rotate_image(heading_deg)
+
+        if self.aircraft_marker is None:
+            self.rotated_image = rotated_image
+            self.aircraft_marker = self.map_widget.set_marker(
+                data.latitude,
+                data.longitude,
+                icon=self.rotated_image,
+                icon_anchor="center",
+            )
+        else:
+            # Move the existing marker; swap its icon only when the heading bucket changes
+            self.aircraft_marker.set_position(data.latitude, data.longitude)
+            if rotated_image is not self.rotated_image:
+                self.rotated_image = rotated_image
+                self.aircraft_marker.change_icon(self.rotated_image)
 
-        self.aircraft_marker = self.map_widget.set_marker(
-            data.latitude,
-            data.longitude,
-            icon=self.rotated_image,
-            icon_anchor="center",
+        if self._map_moved_visibly(data.latitude, data.longitude):
+            self.map_widget.set_position(data.latitude, data.longitude)
+            self._last_set_lat = data.latitude
+            self._last_set_lon = data.longitude
+
+    def _map_moved_visibly(self, lat: float, lon: float) -> bool:
+        """True if lat/lon is at least MAP_PAN_MIN_PX away from the last map center."""
+        if self._last_set_lat is None:
+            return True
+        # Web Mercator pixels per degree at the current zoom
+        px_per_deg = TILE_SIZE_PX * 2 ** self.map_widget.zoom / 360.0
+        dx = (lon - self._last_set_lon) * px_per_deg
+        dy = (lat - self._last_set_lat) * px_per_deg / math.cos(math.radians(lat))
+        return math.hypot(dx, dy) >= MAP_PAN_MIN_PX
+
+    def _extrapolate_marker(self, data: FlightData, dt: float) -> None:
+        """Move the marker along the last ground track between telemetry samples."""
+        if self.aircraft_marker is None or dt > EXTRAPOLATE_MAX_S or data.ground_speed_ms < 1.0:
+            return
+        # True heading: the map is true-north up, so the magnetic heading
+        # shown in the info panel would drift by the local variation
+        track = data.true_heading_rad
+        dist_rad = data.ground_speed_ms * dt / EARTH_RADIUS_M
+        lat = data.latitude + math.cos(track) * dist_rad * RAD_TO_DEG
+        lon = data.longitude + (
+            math.sin(track) * dist_rad * RAD_TO_DEG / math.cos(math.radians(data.latitude))
         )
-
-        self.map_widget.set_position(data.latitude, data.longitude)
+        self.aircraft_marker.set_position(lat, lon)
 
     def _update_info_display(self, data: FlightData) -> None:
         """Update the flight info text display."""
-        import math
-
         # Convert to display units
-        MPS_TO_KT = 1.943844492
         gs_kts = data.ground_speed_ms * MPS_TO_KT
-        heading_deg = math.degrees(data.heading_rad) % 360
-        pitch_deg = math.degrees(data.pitch_rad)
-        bank_deg = math.degrees(data.bank_rad)
+        heading_deg = (data.heading_rad * RAD_TO_DEG) % 360
+        pitch_deg = data.pitch_rad * RAD_TO_DEG
+        bank_deg = data.bank_rad * RAD_TO_DEG
 
         info_text = "=" * 24 + "\n"
         info_text += f"{'Latitude:':<15}{data.latitude:>8.2f}°\n"
@@ -333,12 +546,24 @@ class AircraftTrackerApp:
         info_text += f"{'Bank:':<15}{bank_deg:>8.2f}°\n"
         info_text += "=" * 24 + "\n"
 
-        self.info_display.delete(1.0, tk.END)
-        self.info_display.insert(tk.END, info_text)
+        self._set_info_text(info_text)
+
+    def _set_info_text(self, info_text: str) -> None:
+        """Replace the info display text in one Tk call, only when it changed."""
+        if info_text != self._last_info_text:
+            self.info_display.replace(1.0, tk.END, info_text)
+            self._last_info_text = info_text
 
     def _rotate_image(self, angle_deg: float) -> ImageTk.PhotoImage:
-        """Rotate the aircraft icon to match heading."""
-        return ImageTk.PhotoImage(self.aircraft_image.rotate(-angle_deg))
+        """Rotate the aircraft icon to match heading (cached per heading bucket)."""
+        bucket = int(angle_deg // ICON_ROTATION_STEP_DEG) % (360 // ICON_ROTATION_STEP_DEG)
+        image = self._icon_cache.get(bucket)
+        if image is None:
+            image = ImageTk.PhotoImage(
+                self.aircraft_image.rotate(-bucket * ICON_ROTATION_STEP_DEG)
+            )
+            self._icon_cache[bucket] = image
+        return image
 
     @staticmethod
     def _generate_default_icon(width: int, height: int) -> Image.Image:
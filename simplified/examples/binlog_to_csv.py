@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Aerofly FS4 Reader - Binary Log to CSV
+
+Converts a packed binary log written by flight_logger.py (file name
+ending in .bin) into the same CSV format the logger writes directly.
+
+Usage:
+    python binlog_to_csv.py flight.bin [output.csv]
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from flight_logger import BINLOG_MAGIC, BINLOG_RECORD, CSV_HEADER, format_row
+
+
+def convert(src: Path, dst: Path) -> int:
+    """Converts src to CSV at dst and returns the number of records."""
+    data = src.read_bytes()
+    if not data.startswith(BINLOG_MAGIC):
+        raise ValueError(f"{src} is not a flight_logger binary log")
+
+    body = memoryview(data)[len(BINLOG_MAGIC):]
+    # Ignore a partial record left by an interrupted write
+    body = body[:len(body) - len(body) % BINLOG_RECORD.size]
+
+    count = 0
+    with open(dst, 'wb') as out:
+        out.write(CSV_HEADER)
+        for record in BINLOG_RECORD.iter_unpack(body):
+            row = (
+                datetime.fromtimestamp(record[0]).isoformat(),
+                *record[1:-2],
+                record[-2].rstrip(b'\0').decode('utf-8', 'replace'),
+                record[-1].rstrip(b'\0').decode('utf-8', 'replace'),
+            )
+            out.write(format_row(row))
+            count += 1
+    return count
+
+
+def main():
+    """Main function."""
+    if len(sys.argv) < 2:
+        print("Usage: python binlog_to_csv.py flight.bin [output.csv]")
+        sys.exit(1)
+
+    src = Path(sys.argv[1])
+    dst = Path(sys.argv[2]) if len(sys.argv) > 2 else src.with_suffix('.csv')
+
+    try:
+        count = convert(src, dst)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    print(f"Wrote {count} records to {dst.absolute()}")
+
+
+if __name__ == "__main__":
+    main()
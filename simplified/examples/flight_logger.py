@@ -10,22 +10,55 @@ later analysis. Ideal for:
 
 Usage:
     python flight_logger.py [filename.csv]
+    python flight_logger.py flight.bin   (packed binary log, see binlog_to_csv.py)
 
 The CSV file includes timestamp and all main variables.
 """
 
 import socket
 import json
-import csv
+import os
+import struct
 import sys
 import time
 import math
 from datetime import datetime
 from pathlib import Path
 
-
-# CSV Columns
-CSV_COLUMNS = [
+# Fastest available JSON parser; all of them accept bytes and raise ValueError
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    try:
+        import ujson
+        json_loads = ujson.loads
+    except ImportError:
+        json_loads = json.loads
+
+# Numba is optional; without it the conversion kernel runs as plain Python
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+# Unit conversions
+RAD_TO_DEG = 180.0 / math.pi
+MPS_TO_KT = 1.94384
+MPS_TO_FPM = 196.85
+
+# Preallocated socket receive buffer filled with recv_into() (grows for oversized lines)
+RX_BUFFER_BYTES = 16384
+
+# Rows are buffered and written/flushed together when either limit is reached
+WRITE_BATCH_SIZE = 30
+WRITE_BATCH_INTERVAL_S = 30.0
+
+# CSV Columns, in the order rows are built by process_data()
+CSV_COLUMNS = (
     'timestamp',
     'elapsed_seconds',
     'latitude',
@@ -51,7 +84,23 @@ CSV_COLUMNS = [
     'autopilot_master',
     'aircraft_name',
     'nearest_airport'
-]
+)
+
+# Column name -> position in a row tuple
+_FIELD_INDEX = {name: i for i, name in enumerate(CSV_COLUMNS)}
+
+# Pre-formatted CSV output, byte-for-byte what the csv module wrote: CRLF line
+# endings and str() of each value, which process_data() has already rounded
+CSV_HEADER = (','.join(CSV_COLUMNS) + '\r\n').encode('utf-8')
+ROW_FORMAT = (
+    '%s,%r,%r,%r,%r,%r,%r,%r,%r,%r,%r,%r,%r,%r,%r,'
+    '%d,%r,%r,%r,%d,%d,%d,%d,%s,%s\r\n'
+)
+
+# Packed binary log (files ending in .bin): magic header, then one fixed-size
+# record per row in CSV_COLUMNS order, with the timestamp as epoch seconds
+BINLOG_MAGIC = b'AFS4LOG1'
+BINLOG_RECORD = struct.Struct('<15dB3d4B32s8s')
 
 
 def connect_to_aerofly(host: str = 'localhost', port: int = 12345) -> socket.socket:
@@ -73,59 +122,108 @@ def connect_to_aerofly(host: str = 'localhost', port: int = 12345) -> socket.soc
         sys.exit(1)
 
 
-def ms_to_kts(ms: float) -> float:
-    """Converts m/s to knots."""
-    return ms * 1.94384
-
-
-def ms_to_fpm(ms: float) -> float:
-    """Converts m/s to ft/min."""
-    return ms * 196.85
-
-
-def rad_to_deg(rad: float) -> float:
-    """Converts radians to degrees."""
-    return math.degrees(rad)
-
-
+@njit(cache=True)
 def normalize_longitude(lon_deg: float) -> float:
     """Normalizes longitude from 0-360 to -180/+180."""
-    if lon_deg > 180:
-        return lon_deg - 360
-    return lon_deg
-
-
-def process_data(data: dict, start_time: float) -> dict:
-    """Processes raw data and converts to standard units."""
+    return ((lon_deg + 180.0) % 360.0) - 180.0
+
+
+@njit(cache=True)
+def convert_values(lat, lon, alt, height, ias, gs, vs, mag_hdg, true_hdg,
+                   pitch, bank, mach, aoa, gear, flaps, throttle):
+    """Converts raw simulator floats to rounded CSV units (compiled when numba is available)."""
+    return (
+        round(lat * RAD_TO_DEG, 6),
+        round(normalize_longitude(lon * RAD_TO_DEG), 6),
+        round(alt, 1),
+        round(height, 1),
+        round(ias * MPS_TO_KT, 1),
+        round(gs * MPS_TO_KT, 1),
+        round(vs * MPS_TO_FPM, 0),
+        round((mag_hdg * RAD_TO_DEG) % 360, 1),
+        round((true_hdg * RAD_TO_DEG) % 360, 1),
+        round(pitch * RAD_TO_DEG, 2),
+        round(bank * RAD_TO_DEG, 2),
+        round(mach, 3),
+        round(aoa * RAD_TO_DEG, 2),
+        round(gear, 2),
+        round(flaps * 100, 0),
+        round(throttle * 100, 0),
+    )
+
+
+def process_data(data: dict, start_time: float) -> tuple:
+    """Processes raw data and converts to standard units (row tuple in CSV_COLUMNS order)."""
     elapsed = time.time() - start_time
-
-    return {
-        'timestamp': datetime.now().isoformat(),
-        'elapsed_seconds': round(elapsed, 2),
-        'latitude': round(rad_to_deg(data.get('latitude', 0)), 6),
-        'longitude': round(normalize_longitude(rad_to_deg(data.get('longitude', 0))), 6),
-        'altitude_ft': round(data.get('altitude', 0), 1),
-        'height_agl_ft': round(data.get('height', 0), 1),
-        'indicated_airspeed_kts': round(ms_to_kts(data.get('indicated_airspeed', 0)), 1),
-        'ground_speed_kts': round(ms_to_kts(data.get('ground_speed', 0)), 1),
-        'vertical_speed_fpm': round(ms_to_fpm(data.get('vertical_speed', 0)), 0),
-        'magnetic_heading_deg': round(rad_to_deg(data.get('magnetic_heading', 0)) % 360, 1),
-        'true_heading_deg': round(rad_to_deg(data.get('true_heading', 0)) % 360, 1),
-        'pitch_deg': round(rad_to_deg(data.get('pitch', 0)), 2),
-        'bank_deg': round(rad_to_deg(data.get('bank', 0)), 2),
-        'mach_number': round(data.get('mach_number', 0), 3),
-        'angle_of_attack_deg': round(rad_to_deg(data.get('angle_of_attack', 0)), 2),
-        'on_ground': 1 if data.get('on_ground', 0) > 0.5 else 0,
-        'gear': round(data.get('gear', 0), 2),
-        'flaps_pct': round(data.get('flaps', 0) * 100, 0),
-        'throttle_pct': round(data.get('throttle', 0) * 100, 0),
-        'parking_brake': 1 if data.get('parking_brake', 0) > 0.5 else 0,
-        'engine1_running': 1 if data.get('engine_running_1', 0) > 0.5 else 0,
-        'engine2_running': 1 if data.get('engine_running_2', 0) > 0.5 else 0,
-        'autopilot_master': 1 if data.get('autopilot_master', 0) > 0.5 else 0,
-        'aircraft_name': data.get('aircraft_name', 'Unknown'),
-        'nearest_airport': data.get('nearest_airport_id', '----')
-    }
+    get = data.get
+
+    (lat, lon, alt, height, ias, gs, vs, mag_hdg, true_hdg,
+     pitch, bank, mach, aoa, gear, flaps, throttle) = convert_values(
+        float(get('latitude', 0)), float(get('longitude', 0)),
+        float(get('altitude', 0)), float(get('height', 0)),
+        float(get('indicated_airspeed', 0)), float(get('ground_speed', 0)),
+        float(get('vertical_speed', 0)), float(get('magnetic_heading', 0)),
+        float(get('true_heading', 0)), float(get('pitch', 0)),
+        float(get('bank', 0)), float(get('mach_number', 0)),
+        float(get('angle_of_attack', 0)), float(get('gear', 0)),
+        float(get('flaps', 0)), float(get('throttle', 0)),
+    )
+
+    return (
+        datetime.now().isoformat(),
+        round(elapsed, 2),
+        lat,
+        lon,
+        alt,
+        height,
+        ias,
+        gs,
+        vs,
+        mag_hdg,
+        true_hdg,
+        pitch,
+        bank,
+        mach,
+        aoa,
+        1 if get('on_ground', 0) > 0.5 else 0,
+        gear,
+        flaps,
+        throttle,
+        1 if get('parking_brake', 0) > 0.5 else 0,
+        1 if get('engine_running_1', 0) > 0.5 else 0,
+        1 if get('engine_running_2', 0) > 0.5 else 0,
+        1 if get('autopilot_master', 0) > 0.5 else 0,
+        get('aircraft_name', 'Unknown'),
+        get('nearest_airport_id', '----'),
+    )
+
+
+def _csv_text(value) -> str:
+    """Quotes a text field if it contains CSV special characters."""
+    text = str(value)
+    if ',' in text or '"' in text or '\n' in text or '\r' in text:
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def format_row(row: tuple) -> bytes:
+    """Formats a process_data() row as one CSV line."""
+    return (ROW_FORMAT % (row[:-2] + (_csv_text(row[-2]), _csv_text(row[-1])))).encode('utf-8')
+
+
+def pack_record(row: tuple, wall_time: float) -> bytes:
+    """Packs a process_data() row as one binary log record."""
+    return BINLOG_RECORD.pack(
+        wall_time, *row[1:-2],
+        str(row[-2]).encode('utf-8'), str(row[-1]).encode('utf-8'),
+    )
+
+
+def write_all(fd: int, data) -> None:
+    """Writes all of data to fd (os.write() may write only part of it)."""
+    written = os.write(fd, data)
+    while written < len(data):
+        written += os.write(fd, data[written:])
 
 
 def main():
@@ -143,64 +241,100 @@ def main():
         filename = f"flight_log_{timestamp}.csv"
 
     filepath = Path(filename)
+    binary = filepath.suffix.lower() == '.bin'
     print(f"  Log file: {filepath.absolute()}")
     print()
 
     sock = connect_to_aerofly()
-    buffer = ""
+    rx_buf = bytearray(RX_BUFFER_BYTES)
+    rx_view = memoryview(rx_buf)
+    rx_len = 0  # bytes [0, rx_len) hold data not yet split into lines
     start_time = time.time()
     record_count = 0
     last_log_time = 0
     log_interval = 1.0  # Record every 1 second
-
-    # Create CSV file
-    with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=CSV_COLUMNS)
-        writer.writeheader()
+    pending = bytearray()
+    pending_rows = 0
+    last_flush_time = start_time
+
+    # Create log file (rows are pre-formatted and written with one write_all() per batch)
+    fd = os.open(
+        filepath,
+        os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0),
+        0o644,
+    )
+    try:
+        write_all(fd, BINLOG_MAGIC if binary else CSV_HEADER)
 
         print("  Recording data... (Ctrl+C to stop)")
         print()
 
         try:
             while True:
-                # Receive data
+                # Receive data into the preallocated buffer
                 try:
-                    data = sock.recv(4096).decode('utf-8')
-                    if not data:
+                    if rx_len == len(rx_buf):
+                        # A single line larger than the buffer; grow it
+                        rx_view.release()
+                        rx_buf.extend(bytes(len(rx_buf)))
+                        rx_view = memoryview(rx_buf)
+                    n = sock.recv_into(rx_view[rx_len:])
+                    if not n:
                         print("Connection closed.")
                         break
-                    buffer += data
+                    rx_len += n
                 except socket.timeout:
                     continue
 
+                # Split complete JSON lines; the partial tail moves back to offset 0
+                lines = []
+                start = 0
+                while True:
+                    nl = rx_buf.find(b'\n', start, rx_len)
+                    if nl < 0:
+                        break
+                    lines.append(bytes(rx_view[start:nl]))
+                    start = nl + 1
+                remaining = rx_len - start
+                if remaining and start:
+                    rx_buf[:remaining] = bytes(rx_view[start:rx_len])
+                rx_len = remaining
+
                 # Process JSON lines
-                while '\n' in buffer:
-                    line, buffer = buffer.split('\n', 1)
+                for line in lines:
                     line = line.strip()
 
                     if not line:
                         continue
 
                     try:
-                        flight_data = json.loads(line)
-                    except json.JSONDecodeError:
+                        flight_data = json_loads(line)
+                    except ValueError:
                         continue
 
                     # Record according to interval
                     current_time = time.time()
                     if current_time - last_log_time >= log_interval:
                         row = process_data(flight_data, start_time)
-                        writer.writerow(row)
-                        csvfile.flush()
+                        pending += pack_record(row, current_time) if binary else format_row(row)
+                        pending_rows += 1
 
                         record_count += 1
                         last_log_time = current_time
 
+                        # Write in batches: one write_all() per batch
+                        if (pending_rows >= WRITE_BATCH_SIZE
+                                or current_time - last_flush_time >= WRITE_BATCH_INTERVAL_S):
+                            write_all(fd, pending)
+                            pending.clear()
+                            pending_rows = 0
+                            last_flush_time = current_time
+
                         # Show progress
-                        elapsed = row['elapsed_seconds']
-                        alt = row['altitude_ft']
-                        spd = row['indicated_airspeed_kts']
-                        apt = row['nearest_airport']
+                        elapsed = row[_FIELD_INDEX['elapsed_seconds']]
+                        alt = row[_FIELD_INDEX['altitude_ft']]
+                        spd = row[_FIELD_INDEX['indicated_airspeed_kts']]
+                        apt = row[_FIELD_INDEX['nearest_airport']]
                         print(f"\r  [{elapsed:>8.1f}s] Alt: {alt:>7.0f} ft | IAS: {spd:>5.0f} kts | Near: {apt} | Records: {record_count}", end="")
 
                 time.sleep(0.02)
@@ -208,6 +342,12 @@ def main():
         except KeyboardInterrupt:
             print("\n")
             print("  Stopping recording...")
+    finally:
+        # Write any rows still waiting for a batch, however the loop ended
+        try:
+            write_all(fd, pending)
+        finally:
+            os.close(fd)
 
     # Final summary
     print()
@@ -21,6 +21,7 @@ Requirements:
 """
 
 import json
+import selectors
 import socket
 import sys
 import tkinter as tk
@@ -28,11 +29,296 @@ from tkinter import ttk, filedialog, messagebox
 import threading
 import datetime
 import math
+import operator
+from collections import namedtuple
+
+# pysimdjson is optional; it parses each frame lazily so only the schema
+# fields are materialized. Falls back to stdlib json.
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+# orjson is optional; used to decode frames when pysimdjson is missing and to
+# write JSON snapshots
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+json_loads = orjson.loads if orjson else json.loads
 
 
 TCP_HOST = "localhost"
 TCP_PORT = 12345
-REFRESH_MS = 100
+REFRESH_MS = 33  # UI refresh cap (~30 Hz); the tree is only redrawn after a new frame
+RX_BUFFER_BYTES = 65536  # Preallocated receive buffer (grows for oversized lines)
+RECV_BUFFER_BYTES = 1 << 20  # Kernel socket receive buffer (SO_RCVBUF)
+RECONNECT_MIN_S = 0.5  # Reconnect backoff, doubled after each failed attempt
+RECONNECT_MAX_S = 8.0
+
+# Marks tree rows that have not been drawn yet
+_UNSET = object()
+
+RAD_TO_DEG = 180.0 / math.pi
+MPS_TO_KT = 1.94384
+MPS_TO_KMH = 3.6
+FT_TO_M = 0.3048
+
+
+# Value formatters, bound per tree row by formatters_for() so refresh_tick
+# calls them directly instead of dispatching on the unit for every value.
+# The hot ones use %-formatting with the multiplier bound as a default
+# argument (a local lookup instead of a global one).
+def _raw_number(value) -> str:
+    return "%.6f" % value
+
+
+def _raw_bool(value) -> str:
+    return "1" if value else "0"
+
+
+# The producer always sends vectors as {"x", "y", "z"} objects
+_xyz = operator.itemgetter("x", "y", "z")
+
+
+def _raw_vector(value) -> str:
+    return "{x:%.2f, y:%.2f, z:%.2f}" % _xyz(value)
+
+
+def _text(value) -> str:
+    return value if isinstance(value, str) else str(value)
+
+
+def _on_off(value) -> str:
+    return "ON" if value else "OFF"
+
+
+def _vector(value) -> str:
+    return "(%.2f, %.2f, %.2f)" % _xyz(value)
+
+
+def _angle_deg(value, k=RAD_TO_DEG) -> str:
+    return "%.1f°" % (value * k)
+
+
+def _longitude_deg(value, k=RAD_TO_DEG) -> str:
+    # Normalize longitude from 0-360 to -180/+180
+    deg = value * k
+    if deg > 180:
+        deg -= 360
+    return "%.1f°" % deg
+
+
+def _heading_deg(value, k=RAD_TO_DEG) -> str:
+    # Headings and courses keep the 0-360 range
+    return "%.1f°" % ((value * k) % 360)
+
+
+def _speed_kmh(value, k=MPS_TO_KMH) -> str:
+    return "%.1f km/h" % (value * k)
+
+
+def _speed_kts(value, k=MPS_TO_KT) -> str:
+    return "%.1f kts" % (value * k)
+
+
+def _altitude_m(value, k=FT_TO_M) -> str:
+    return "%.1f m" % (value * k)
+
+
+def _altitude_ft(value) -> str:
+    return "%.0f ft" % value
+
+
+def _degrees(value) -> str:
+    return f"{value:.6f}°"
+
+
+def _mhz(value) -> str:
+    return f"{value:.3f} MHz"
+
+
+def _hertz(value) -> str:
+    return f"{value:.2f} Hz"
+
+
+def _mach(value) -> str:
+    return f"M {value:.3f}"
+
+
+def _percent(value) -> str:
+    return f"{value * 100:.0f}%"
+
+
+# Local UTC offset, taken once at startup so _clock_ms needs no datetime per frame
+_UTC_OFFSET_MS = int(datetime.datetime.now().astimezone().utcoffset().total_seconds() * 1000)
+
+
+def _clock_ms(value, offset=_UTC_OFFSET_MS) -> str:
+    # Local wall-clock time of an epoch timestamp in milliseconds
+    ms = int(value) + offset
+    s = ms // 1000
+    return "%02d:%02d:%02d.%03d" % (s // 3600 % 24, s // 60 % 60, s % 60, ms % 1000)
+
+
+def _counter(value) -> str:
+    return str(int(value))
+
+
+def _dash(value) -> str:
+    return "-"
+
+
+# unit -> (raw, INTL, US) formatters
+UNIT_FORMATTERS = {
+    "string": (_text, _text, _text),
+    "boolean": (_raw_bool, _on_off, _on_off),
+    "vector3d": (_raw_vector, _vector, _vector),
+    "radians": (_raw_number, _heading_deg, _heading_deg),
+    "m/s": (_raw_number, _speed_kmh, _speed_kts),
+    "feet": (_raw_number, _altitude_m, _altitude_ft),
+    "degrees": (_raw_number, _degrees, _degrees),
+    "MHz": (_raw_number, _mhz, _mhz),
+    "hertz": (_raw_number, _hertz, _hertz),
+    "mach": (_raw_number, _mach, _mach),
+    "position": (_raw_number, _percent, _percent),
+    "milliseconds": (_raw_number, _clock_ms, _clock_ms),
+    "counter": (_raw_number, _counter, _counter),
+}
+
+
+# unit -> decimal places a value is rounded to before comparing it with the
+# value last drawn; changes below the display precision skip the row
+QUANTIZE = {
+    "feet": 0,
+    "m/s": 2,
+    "radians": 4,
+    "degrees": 6,
+    "MHz": 3,
+    "hertz": 2,
+    "mach": 3,
+    "position": 2,
+    "milliseconds": 0,
+    "counter": 0,
+}
+
+
+def _quantize_vector(value):
+    try:
+        x, y, z = _xyz(value)
+        return (round(x, 2), round(y, 2), round(z, 2))
+    except (TypeError, KeyError):
+        return value
+
+
+def quantizer_for(unit: str):
+    """Return the function that rounds a row's value to its display precision.
+
+    Returns None for units compared as-is (strings, booleans).
+    """
+    if unit == "vector3d":
+        return _quantize_vector
+    digits = QUANTIZE.get(unit)
+    if digits is None:
+        return None
+
+    def quantize(value):
+        try:
+            return round(value, digits)
+        except TypeError:
+            return value
+
+    return quantize
+
+
+def formatters_for(field_name: str, unit: str):
+    """Return the (raw, INTL, US) formatters for a tree row."""
+    if unit == "radians" and field_name == "latitude":
+        return (_raw_number, _angle_deg, _angle_deg)
+    if unit == "radians" and field_name == "longitude":
+        return (_raw_number, _longitude_deg, _longitude_deg)
+    return UNIT_FORMATTERS.get(unit, (_raw_number, _dash, _dash))
+
+
+# Monitor schema: tree categories and their (field, unit) rows, in display order
+CATEGORIES = {
+    "System": (
+        ("schema", "string"),
+        ("version", "string"),
+        ("update_hz", "hertz"),
+        ("timestamp", "milliseconds"),
+        ("data_valid", "boolean"),
+        ("update_counter", "counter"),
+    ),
+    "Position": (
+        ("latitude", "radians"),
+        ("longitude", "radians"),
+        ("altitude", "feet"),
+        ("height", "feet"),
+    ),
+    "Orientation": (
+        ("pitch", "radians"),
+        ("bank", "radians"),
+        ("true_heading", "radians"),
+        ("magnetic_heading", "radians"),
+    ),
+    "Speed": (
+        ("indicated_airspeed", "m/s"),
+        ("ground_speed", "m/s"),
+        ("vertical_speed", "m/s"),
+        ("mach_number", "mach"),
+        ("angle_of_attack", "radians"),
+    ),
+    "Aircraft State": (
+        ("on_ground", "boolean"),
+        ("gear", "position"),
+        ("flaps", "position"),
+        ("throttle", "position"),
+        ("parking_brake", "boolean"),
+    ),
+    "Engines": (
+        ("engine_running_1", "boolean"),
+        ("engine_running_2", "boolean"),
+        ("engine_throttle_1", "position"),
+        ("engine_throttle_2", "position"),
+    ),
+    "Navigation": (
+        ("nav1_frequency", "MHz"),
+        ("nav2_frequency", "MHz"),
+        ("com1_frequency", "MHz"),
+        ("com2_frequency", "MHz"),
+        ("selected_course_1", "radians"),
+        ("selected_course_2", "radians"),
+    ),
+    "Autopilot": (
+        ("autopilot_master", "boolean"),
+        ("autopilot_heading", "radians"),
+        ("autopilot_altitude", "feet"),
+    ),
+    "V-Speeds": (
+        ("vs0", "m/s"),
+        ("vs1", "m/s"),
+        ("vfe", "m/s"),
+        ("vno", "m/s"),
+        ("vne", "m/s"),
+    ),
+    "Vectors": (
+        ("position", "vector3d"),
+        ("velocity", "vector3d"),
+    ),
+    "Aircraft Info": (
+        ("aircraft_name", "string"),
+        ("nearest_airport_id", "string"),
+        ("nearest_airport_name", "string"),
+    ),
+}
+
+FIELDS = tuple(name for fields in CATEGORIES.values() for name, _ in fields)
+
+# One decoded frame; fields missing from the frame are None. refresh_tick walks
+# it by position in the same order as the tree rows.
+AeroflyState = namedtuple("AeroflyState", FIELDS, defaults=(None,) * len(FIELDS))
 
 
 class DataReceiver:
@@ -42,93 +328,196 @@ class DataReceiver:
         self.host = host
         self.port = port
         self.socket = None
-        self.latest_data = {}
+        self.latest_data = None  # AeroflyState
         self.running = False
         self.receive_thread = None
         self.connected = False
+        # Set by the receive thread for each new frame, cleared by the UI once drawn
+        self.new_data = threading.Event()
+        self._data_lock = threading.Lock()
+        self._parser = simdjson.Parser() if simdjson else None
+        # Fallback decoder bound once (orjson or stdlib json; both accept bytes)
+        self._decode = json_loads
+
+        # Receive buffer: bytes [0, _rx_len) hold data not yet split into lines
+        self._rx_buf = bytearray(RX_BUFFER_BYTES)
+        self._rx_view = memoryview(self._rx_buf)
+        self._rx_len = 0
+
+        # Created by start_receiving()
+        self._selector = None
+        self._wakeup_r = None
+        self._wakeup_w = None
+
+    def _close_socket(self):
+        """Unregister and close the data socket, if any."""
+        self.connected = False
+        if not self.socket:
+            return
+        try:
+            self._selector.unregister(self.socket)
+        except (KeyError, ValueError):
+            pass
+        try:
+            self.socket.close()
+        except Exception:
+            pass
+        self.socket = None
 
     def connect(self):
         """Connect to the TCP server."""
         try:
-            if self.socket:
-                try:
-                    self.socket.close()
-                except Exception:
-                    pass
+            self._close_socket()
 
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RECV_BUFFER_BYTES)
             self.socket.settimeout(5.0)
             self.socket.connect((self.host, self.port))
-            self.socket.settimeout(1.0)
+            # Non-blocking: the selector reports when data is ready
+            self.socket.setblocking(False)
+            self._selector.register(self.socket, selectors.EVENT_READ)
+            self._rx_len = 0
             self.connected = True
             return True
         except Exception as e:
             print(f"Connection error: {e}")
-            self.connected = False
+            self._close_socket()
             return False
 
     def start_receiving(self):
         """Start the background receiver thread."""
+        if self.running:
+            return
         self.running = True
+        self._selector = selectors.DefaultSelector()
+        # Socket pair (portable, unlike os.pipe on Windows) used by stop() to wake select()
+        self._wakeup_r, self._wakeup_w = socket.socketpair()
+        self._wakeup_r.setblocking(False)
+        self._selector.register(self._wakeup_r, selectors.EVENT_READ)
         self.receive_thread = threading.Thread(target=self._receive_loop, daemon=True)
         self.receive_thread.start()
 
+    def _recv(self):
+        """Receive into the preallocated buffer; returns the byte count (0 = closed)."""
+        if self._rx_len == len(self._rx_buf):
+            # A single line larger than the buffer; grow it
+            self._rx_view.release()
+            self._rx_buf.extend(bytes(len(self._rx_buf)))
+            self._rx_view = memoryview(self._rx_buf)
+
+        n = self.socket.recv_into(self._rx_view[self._rx_len:])
+        self._rx_len += n
+        return n
+
+    def _process_buffered_lines(self):
+        """Process complete lines in the receive buffer, then keep the partial tail."""
+        buf = self._rx_buf
+        start = 0
+        while (idx := buf.find(b"\n", start, self._rx_len)) != -1:
+            line = bytes(self._rx_view[start:idx])
+            start = idx + 1
+            if not line.strip():
+                continue
+            self._process_line(line)
+        remaining = self._rx_len - start
+        if remaining and start:
+            buf[:remaining] = bytes(self._rx_view[start:self._rx_len])
+        self._rx_len = remaining
+
+    def _drain_socket(self):
+        """Read everything queued on the data socket."""
+        while True:
+            try:
+                n = self._recv()
+            except BlockingIOError:
+                return
+            if not n:
+                # Connection closed by peer; reconnect from the main loop
+                self._close_socket()
+                return
+            self._process_buffered_lines()
+
     def _receive_loop(self):
-        """Main receive loop."""
-        buffer = ""
+        """Main receive loop; sleeps in select() until data, a stop request or a retry is due."""
+        backoff = RECONNECT_MIN_S
         while self.running:
             try:
-                if not self.socket or not self.connected:
-                    if not self.connect():
-                        import time
-                        time.sleep(2.0)
-                        continue
-
-                data = self.socket.recv(16384).decode("utf-8")
-                if not data:
-                    self.connected = False
-                    import time
-                    time.sleep(0.5)
-                    continue
-
-                buffer += data
-                while "\n" in buffer:
-                    line, buffer = buffer.split("\n", 1)
-                    if not line.strip():
-                        continue
-                    self._process_line(line)
+                timeout = None
+                if not self.connected:
+                    if self.connect():
+                        backoff = RECONNECT_MIN_S
+                    else:
+                        # Wait before retrying; stop() still wakes the selector
+                        timeout = backoff
+                        backoff = min(backoff * 2, RECONNECT_MAX_S)
+
+                for key, _ in self._selector.select(timeout=timeout):
+                    if key.fileobj is self._wakeup_r:
+                        try:
+                            self._wakeup_r.recv(64)
+                        except BlockingIOError:
+                            pass
+                    elif self.connected:
+                        self._drain_socket()
 
-            except socket.timeout:
-                continue
             except Exception as e:
                 print(f"Receive error: {e}")
-                self.connected = False
-                try:
-                    if self.socket:
-                        self.socket.close()
-                except Exception:
-                    pass
-                self.socket = None
-                import time
-                time.sleep(1.0)
-
-    def _process_line(self, line: str):
-        """Process a single JSON line."""
+                self._close_socket()
+
+    def _process_line(self, line: bytes):
+        """Process a single JSON line into an AeroflyState."""
+        if self._parser is None:
+            try:
+                data = self._decode(line)
+            except ValueError:
+                return
+            if isinstance(data, dict):
+                self._publish(AeroflyState._make(map(data.get, FIELDS)))
+            return
+
         try:
-            self.latest_data = json.loads(line)
-        except json.JSONDecodeError:
-            pass
+            doc = self._parser.parse(line)
+        except ValueError:
+            return
+        if not isinstance(doc, simdjson.Object):
+            return
+        values = []
+        for name in FIELDS:
+            value = doc.get(name)
+            if isinstance(value, simdjson.Object):
+                value = value.as_dict()
+            values.append(value)
+        # Release the document before the parser is reused for the next line
+        del doc
+        self._publish(AeroflyState._make(values))
+
+    def _publish(self, data: AeroflyState):
+        """Store a decoded frame and flag it for the UI."""
+        with self._data_lock:
+            self.latest_data = data
+        self.new_data.set()
+
+    def get_latest_data(self) -> AeroflyState:
+        """Return the most recent frame (frames are replaced, never mutated)."""
+        with self._data_lock:
+            return self.latest_data
 
     def stop(self):
         """Stop the receiver."""
+        if not self.running:
+            return
         self.running = False
+        try:
+            self._wakeup_w.send(b"\0")
+        except OSError:
+            pass
         if self.receive_thread:
             self.receive_thread.join(timeout=1.5)
-        if self.socket:
-            try:
-                self.socket.close()
-            except Exception:
-                pass
+        self._close_socket()
+        self._selector.close()
+        self._wakeup_r.close()
+        self._wakeup_w.close()
 
 
 class AeroflyMonitorApp(tk.Tk):
@@ -140,7 +529,13 @@ class AeroflyMonitorApp(tk.Tk):
         self.geometry("1100x700")
 
         self.receiver = DataReceiver()
-        self.tree_items = {}  # item_id -> field_name
+        # Tree rows as parallel lists, in display order
+        self._row_ids = []
+        self._row_fields = []
+        self._row_units = []
+        self._row_formatters = []  # (raw_f, intl_f, us_f)
+        self._row_quantize = []  # quantizer_for(unit) or None
+        self._row_prev = []  # quantized value last drawn
         self.group_nodes = {}  # group -> item_id
 
         # Top bar
@@ -185,86 +580,18 @@ class AeroflyMonitorApp(tk.Tk):
 
     def _build_tree_structure(self):
         """Build the tree structure with categories."""
-        # Define categories and their fields
-        categories = {
-            "System": [
-                ("schema", "string"),
-                ("version", "string"),
-                ("update_hz", "hertz"),
-                ("timestamp", "milliseconds"),
-                ("data_valid", "boolean"),
-                ("update_counter", "counter"),
-            ],
-            "Position": [
-                ("latitude", "radians"),
-                ("longitude", "radians"),
-                ("altitude", "feet"),
-                ("height", "feet"),
-            ],
-            "Orientation": [
-                ("pitch", "radians"),
-                ("bank", "radians"),
-                ("true_heading", "radians"),
-                ("magnetic_heading", "radians"),
-            ],
-            "Speed": [
-                ("indicated_airspeed", "m/s"),
-                ("ground_speed", "m/s"),
-                ("vertical_speed", "m/s"),
-                ("mach_number", "mach"),
-                ("angle_of_attack", "radians"),
-            ],
-            "Aircraft State": [
-                ("on_ground", "boolean"),
-                ("gear", "position"),
-                ("flaps", "position"),
-                ("throttle", "position"),
-                ("parking_brake", "boolean"),
-            ],
-            "Engines": [
-                ("engine_running_1", "boolean"),
-                ("engine_running_2", "boolean"),
-                ("engine_throttle_1", "position"),
-                ("engine_throttle_2", "position"),
-            ],
-            "Navigation": [
-                ("nav1_frequency", "MHz"),
-                ("nav2_frequency", "MHz"),
-                ("com1_frequency", "MHz"),
-                ("com2_frequency", "MHz"),
-                ("selected_course_1", "radians"),
-                ("selected_course_2", "radians"),
-            ],
-            "Autopilot": [
-                ("autopilot_master", "boolean"),
-                ("autopilot_heading", "radians"),
-                ("autopilot_altitude", "feet"),
-            ],
-            "V-Speeds": [
-                ("vs0", "m/s"),
-                ("vs1", "m/s"),
-                ("vfe", "m/s"),
-                ("vno", "m/s"),
-                ("vne", "m/s"),
-            ],
-            "Vectors": [
-                ("position", "vector3d"),
-                ("velocity", "vector3d"),
-            ],
-            "Aircraft Info": [
-                ("aircraft_name", "string"),
-                ("nearest_airport_id", "string"),
-                ("nearest_airport_name", "string"),
-            ],
-        }
-
-        for category, fields in categories.items():
+        for category, fields in CATEGORIES.items():
             node = self.tree.insert("", "end", text=category, values=("", "", "", "", ""))
             self.group_nodes[category] = node
 
             for field_name, unit in fields:
                 item_id = self.tree.insert(node, "end", text="", values=(field_name, "", unit, "", ""))
-                self.tree_items[item_id] = (field_name, unit)
+                self._row_ids.append(item_id)
+                self._row_fields.append(field_name)
+                self._row_units.append(unit)
+                self._row_formatters.append(formatters_for(field_name, unit))
+                self._row_quantize.append(quantizer_for(unit))
+                self._row_prev.append(_UNSET)
 
             self.tree.item(node, open=True)
 
@@ -286,32 +613,47 @@ class AeroflyMonitorApp(tk.Tk):
         try:
             if self.receiver.connected and self.receiver.latest_data:
                 self.status_var.set("Status: Connected")
-                data = self.receiver.latest_data
+                # Nothing to redraw until the receive thread delivers a new frame
+                if not self.receiver.new_data.is_set():
+                    return
+                self.receiver.new_data.clear()
+                data = self.receiver.get_latest_data()
 
                 # Update info
-                update_hz = data.get("update_hz", 0)
-                update_count = data.get("update_counter", 0)
+                update_hz = data.update_hz or 0
+                update_count = data.update_counter or 0
                 self.info_var.set(f"Updates: {update_count} | Rate: {update_hz:.1f} Hz")
 
-                # Update tree
-                for item_id, (field_name, unit) in self.tree_items.items():
-                    value = data.get(field_name)
+                # Update tree: rows are in FIELDS order, so the frame is walked
+                # by position. Only rows whose value changed at display
+                # precision are reformatted
+                prev = self._row_prev
+                rows = zip(self._row_ids, self._row_fields, self._row_units,
+                           self._row_formatters, self._row_quantize, data)
+                for i, (item_id, field_name, unit, fmts, quantize, value) in enumerate(rows):
+                    raw_f, intl_f, us_f = fmts
+                    q = quantize(value) if quantize is not None and value is not None else value
+                    if q == prev[i]:
+                        continue
+                    prev[i] = q
 
                     if value is None:
                         raw_str = "N/A"
                         intl_str = "N/A"
                         us_str = "N/A"
                     else:
-                        raw_str = self._format_raw(value, unit)
-                        intl_str = self._format_converted(value, unit, "intl", field_name)
-                        us_str = self._format_converted(value, unit, "us", field_name)
-
-                    if self.tree.set(item_id, "value") != raw_str:
-                        self.tree.set(item_id, "value", raw_str)
-                    if self.tree.set(item_id, "intl") != intl_str:
-                        self.tree.set(item_id, "intl", intl_str)
-                    if self.tree.set(item_id, "us") != us_str:
-                        self.tree.set(item_id, "us", us_str)
+                        try:
+                            raw_str = raw_f(value)
+                        except (TypeError, ValueError, AttributeError, KeyError):
+                            raw_str = str(value)
+                        try:
+                            intl_str = intl_f(value)
+                            us_str = us_f(value)
+                        except (TypeError, ValueError, AttributeError, KeyError,
+                                OverflowError, OSError):
+                            intl_str = us_str = "N/A"
+
+                    self.tree.item(item_id, values=(field_name, raw_str, unit, intl_str, us_str))
             elif self.receiver.running:
                 self.status_var.set("Status: Connecting...")
             else:
@@ -322,96 +664,6 @@ class AeroflyMonitorApp(tk.Tk):
         finally:
             self.after(REFRESH_MS, self.refresh_tick)
 
-    def _format_raw(self, value, unit: str) -> str:
-        """Format raw value."""
-        if isinstance(value, dict):
-            return f"{{x:{value.get('x', 0):.2f}, y:{value.get('y', 0):.2f}, z:{value.get('z', 0):.2f}}}"
-        elif isinstance(value, str):
-            return value
-        elif isinstance(value, bool) or unit == "boolean":
-            return "1" if value else "0"
-        elif isinstance(value, (int, float)):
-            return f"{value:.6f}"
-        else:
-            return str(value)
-
-    def _format_converted(self, value, unit: str, target: str, field_name: str = "") -> str:
-        """Format converted value for INTL or US."""
-        try:
-            # Handle vectors
-            if isinstance(value, dict):
-                x = value.get('x', 0)
-                y = value.get('y', 0)
-                z = value.get('z', 0)
-                return f"({x:.2f}, {y:.2f}, {z:.2f})"
-
-            # Handle strings
-            if isinstance(value, str):
-                return value
-
-            # Handle booleans
-            if isinstance(value, bool) or unit == "boolean":
-                return "ON" if value else "OFF"
-
-            # Handle numeric values
-            if not isinstance(value, (int, float)):
-                return str(value)
-
-            # Conversions based on unit
-            if unit == "radians":
-                deg = math.degrees(value)
-                # Normalize longitude from 0-360 to -180/+180
-                if field_name == "longitude" and deg > 180:
-                    deg -= 360
-                # For headings, keep 0-360 range
-                elif field_name not in ("latitude", "longitude"):
-                    deg = deg % 360
-                return f"{deg:.1f}°"
-
-            elif unit == "m/s":
-                if target == "us":
-                    kts = value * 1.94384
-                    return f"{kts:.1f} kts"
-                else:
-                    kmh = value * 3.6
-                    return f"{kmh:.1f} km/h"
-
-            elif unit == "feet":
-                if target == "us":
-                    return f"{value:.0f} ft"
-                else:
-                    m = value * 0.3048
-                    return f"{m:.1f} m"
-
-            elif unit == "degrees":
-                return f"{value:.6f}°"
-
-            elif unit == "MHz":
-                return f"{value:.3f} MHz"
-
-            elif unit == "hertz":
-                return f"{value:.2f} Hz"
-
-            elif unit == "mach":
-                return f"M {value:.3f}"
-
-            elif unit == "position":
-                pct = value * 100
-                return f"{pct:.0f}%"
-
-            elif unit == "milliseconds":
-                dt = datetime.datetime.fromtimestamp(value / 1000.0)
-                return dt.strftime("%H:%M:%S.%f")[:-3]
-
-            elif unit == "counter":
-                return str(int(value))
-
-            else:
-                return "-"
-
-        except Exception:
-            return "N/A"
-
     def on_export_snapshot(self):
         """Export current data to JSON or CSV."""
         try:
@@ -437,7 +689,7 @@ class AeroflyMonitorApp(tk.Tk):
             snapshot = {
                 "schema": "aerofly-reader-monitor-snapshot",
                 "timestamp": datetime.datetime.now().isoformat(),
-                "data": self.receiver.latest_data,
+                "data": self.receiver.latest_data._asdict(),
             }
 
             if ext == ".csv":
@@ -445,9 +697,14 @@ class AeroflyMonitorApp(tk.Tk):
                 with open(path, "w", newline="", encoding="utf-8") as f:
                     writer = csv.writer(f)
                     writer.writerow(["variable", "value", "unit"])
-                    for item_id, (field_name, unit) in self.tree_items.items():
-                        value = self.receiver.latest_data.get(field_name, "")
+                    for field_name, unit in zip(self._row_fields, self._row_units):
+                        value = getattr(self.receiver.latest_data, field_name)
+                        if value is None:
+                            value = ""
                         writer.writerow([field_name, value, unit])
+            elif orjson:
+                with open(path, "wb") as f:
+                    f.write(orjson.dumps(snapshot, option=orjson.OPT_INDENT_2))
             else:
                 with open(path, "w", encoding="utf-8") as f:
                     json.dump(snapshot, f, ensure_ascii=False, indent=2)
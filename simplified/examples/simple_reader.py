@@ -16,20 +16,40 @@ Requirements:
 import socket
 import json
 import sys
-import time
 import math
 from datetime import datetime
 
+# pysimdjson is optional; its documents are parsed lazily, so only the
+# fields displayed are materialized. Falls back to stdlib json.
+try:
+    import simdjson
+    parse_json = simdjson.Parser().parse
+except ImportError:
+    parse_json = json.loads
+
+# Unit conversions
+RAD_TO_DEG = 180.0 / math.pi
+MPS_TO_KT = 1.94384
+MPS_TO_FPM = 196.85
+
+# Socket tuning: kernel receive buffer (SO_RCVBUF) and bytes read per recv()
+RECV_BUFFER_BYTES = 1 << 20
+RECV_CHUNK_BYTES = 65536
+
 
 def connect_to_aerofly(host: str = 'localhost', port: int = 12345) -> socket.socket:
     """Connects to the AeroflyReader TCP server."""
     print(f"Connecting to {host}:{port}...")
 
     sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RECV_BUFFER_BYTES)
     sock.settimeout(5.0)
 
     try:
         sock.connect((host, port))
+        # Block in recv() until data arrives; the timeout only keeps Ctrl+C responsive
+        sock.settimeout(1.0)
         print("Connected!")
         return sock
     except socket.timeout:
@@ -42,14 +62,13 @@ def connect_to_aerofly(host: str = 'localhost', port: int = 12345) -> socket.soc
 
 def format_heading(radians: float) -> str:
     """Converts radians to heading degrees (000-360)."""
-    import math
-    degrees = math.degrees(radians) % 360
+    degrees = (radians * RAD_TO_DEG) % 360
     return f"{degrees:03.0f}°"
 
 
 def format_speed_kts(ms: float) -> str:
     """Converts m/s to knots."""
-    kts = ms * 1.94384
+    kts = ms * MPS_TO_KT
     return f"{kts:.0f} kts"
 
 
@@ -60,98 +79,102 @@ def format_altitude(feet: float) -> str:
 
 def format_vs(ms: float) -> str:
     """Converts vertical speed from m/s to ft/min."""
-    ftmin = ms * 196.85
+    ftmin = ms * MPS_TO_FPM
     sign = "+" if ftmin > 0 else ""
     return f"{sign}{ftmin:.0f} fpm"
 
 
 def display_flight_data(data: dict):
     """Displays flight data in a readable format."""
+    get = data.get
+    out = []
 
-    # Clear screen (optional, comment out if it doesn't work on your terminal)
-    print("\033[H\033[J", end="")
-
-    print("=" * 60)
-    print("         AEROFLY FS4 READER - Flight Data")
-    print("=" * 60)
-    print()
+    out.append("=" * 60)
+    out.append("         AEROFLY FS4 READER - Flight Data")
+    out.append("=" * 60)
+    out.append("")
 
     # Aircraft and basic information
-    print(f"  Aircraft: {data.get('aircraft_name', 'Unknown')}")
-    print(f"  Nearest airport: {data.get('nearest_airport_id', '----')} - {data.get('nearest_airport_name', 'Unknown')}")
-    print()
+    out.append(f"  Aircraft: {get('aircraft_name', 'Unknown')}")
+    out.append(f"  Nearest airport: {get('nearest_airport_id', '----')} - {get('nearest_airport_name', 'Unknown')}")
+    out.append("")
 
     # Position (convert from radians to degrees, normalize longitude to -180/+180)
-    lat = math.degrees(data.get('latitude', 0))
-    lon = math.degrees(data.get('longitude', 0))
+    lat = get('latitude', 0) * RAD_TO_DEG
+    lon = get('longitude', 0) * RAD_TO_DEG
     if lon > 180:
         lon -= 360
-    print("  POSITION")
-    print(f"    Lat: {lat:+.6f}°")
-    print(f"    Lon: {lon:+.6f}°")
-    print()
+    out.append("  POSITION")
+    out.append(f"    Lat: {lat:+.6f}°")
+    out.append(f"    Lon: {lon:+.6f}°")
+    out.append("")
 
     # Altitudes and speeds
-    print("  ALTITUDE & SPEED")
-    print(f"    Altitude MSL: {format_altitude(data.get('altitude', 0))}")
-    print(f"    Height AGL:   {format_altitude(data.get('height', 0))}")
-    print(f"    IAS:          {format_speed_kts(data.get('indicated_airspeed', 0))}")
-    print(f"    GS:           {format_speed_kts(data.get('ground_speed', 0))}")
-    print(f"    VS:           {format_vs(data.get('vertical_speed', 0))}")
-    print()
+    out.append("  ALTITUDE & SPEED")
+    out.append(f"    Altitude MSL: {format_altitude(get('altitude', 0))}")
+    out.append(f"    Height AGL:   {format_altitude(get('height', 0))}")
+    out.append(f"    IAS:          {format_speed_kts(get('indicated_airspeed', 0))}")
+    out.append(f"    GS:           {format_speed_kts(get('ground_speed', 0))}")
+    out.append(f"    VS:           {format_vs(get('vertical_speed', 0))}")
+    out.append("")
 
     # Orientation
-    print("  ORIENTATION")
-    print(f"    Mag Heading:  {format_heading(data.get('magnetic_heading', 0))}")
-    print(f"    True Heading: {format_heading(data.get('true_heading', 0))}")
-    pitch_deg = math.degrees(data.get('pitch', 0))
-    bank_deg = math.degrees(data.get('bank', 0))
-    print(f"    Pitch:        {pitch_deg:+.1f}°")
-    print(f"    Bank:         {bank_deg:+.1f}°")
-    print()
+    out.append("  ORIENTATION")
+    out.append(f"    Mag Heading:  {format_heading(get('magnetic_heading', 0))}")
+    out.append(f"    True Heading: {format_heading(get('true_heading', 0))}")
+    pitch_deg = get('pitch', 0) * RAD_TO_DEG
+    bank_deg = get('bank', 0) * RAD_TO_DEG
+    out.append(f"    Pitch:        {pitch_deg:+.1f}°")
+    out.append(f"    Bank:         {bank_deg:+.1f}°")
+    out.append("")
 
     # State
-    print("  STATE")
-    on_ground = "ON GROUND" if data.get('on_ground', 0) > 0.5 else "IN FLIGHT"
-    gear = "DOWN" if data.get('gear', 0) > 0.5 else "UP"
-    flaps = f"{data.get('flaps', 0) * 100:.0f}%"
-    throttle = f"{data.get('throttle', 0) * 100:.0f}%"
-    print(f"    {on_ground}")
-    print(f"    Gear:     {gear}")
-    print(f"    Flaps:    {flaps}")
-    print(f"    Throttle: {throttle}")
-    print()
+    out.append("  STATE")
+    on_ground = "ON GROUND" if get('on_ground', 0) > 0.5 else "IN FLIGHT"
+    gear = "DOWN" if get('gear', 0) > 0.5 else "UP"
+    flaps = f"{get('flaps', 0) * 100:.0f}%"
+    throttle = f"{get('throttle', 0) * 100:.0f}%"
+    out.append(f"    {on_ground}")
+    out.append(f"    Gear:     {gear}")
+    out.append(f"    Flaps:    {flaps}")
+    out.append(f"    Throttle: {throttle}")
+    out.append("")
 
     # Engines
-    eng1 = "ON" if data.get('engine_running_1', 0) > 0.5 else "OFF"
-    eng2 = "ON" if data.get('engine_running_2', 0) > 0.5 else "OFF"
-    print("  ENGINES")
-    print(f"    Engine 1: {eng1} ({data.get('engine_throttle_1', 0) * 100:.0f}%)")
-    print(f"    Engine 2: {eng2} ({data.get('engine_throttle_2', 0) * 100:.0f}%)")
-    print()
+    eng1 = "ON" if get('engine_running_1', 0) > 0.5 else "OFF"
+    eng2 = "ON" if get('engine_running_2', 0) > 0.5 else "OFF"
+    out.append("  ENGINES")
+    out.append(f"    Engine 1: {eng1} ({get('engine_throttle_1', 0) * 100:.0f}%)")
+    out.append(f"    Engine 2: {eng2} ({get('engine_throttle_2', 0) * 100:.0f}%)")
+    out.append("")
 
     # Autopilot
-    ap_on = "ON" if data.get('autopilot_master', 0) > 0.5 else "OFF"
-    print("  AUTOPILOT")
-    print(f"    Master:   {ap_on}")
+    ap_on = "ON" if get('autopilot_master', 0) > 0.5 else "OFF"
+    out.append("  AUTOPILOT")
+    out.append(f"    Master:   {ap_on}")
     if ap_on == "ON":
-        print(f"    HDG:      {format_heading(data.get('autopilot_heading', 0))}")
-        print(f"    ALT:      {format_altitude(data.get('autopilot_altitude', 0))}")
-    print()
+        out.append(f"    HDG:      {format_heading(get('autopilot_heading', 0))}")
+        out.append(f"    ALT:      {format_altitude(get('autopilot_altitude', 0))}")
+    out.append("")
 
     # V-Speeds
-    print("  V-SPEEDS")
-    print(f"    VS0: {format_speed_kts(data.get('vs0', 0))}  VS1: {format_speed_kts(data.get('vs1', 0))}")
-    print(f"    VFE: {format_speed_kts(data.get('vfe', 0))}  VNO: {format_speed_kts(data.get('vno', 0))}  VNE: {format_speed_kts(data.get('vne', 0))}")
-    print()
+    out.append("  V-SPEEDS")
+    out.append(f"    VS0: {format_speed_kts(get('vs0', 0))}  VS1: {format_speed_kts(get('vs1', 0))}")
+    out.append(f"    VFE: {format_speed_kts(get('vfe', 0))}  VNO: {format_speed_kts(get('vno', 0))}  VNE: {format_speed_kts(get('vne', 0))}")
+    out.append("")
 
     # Footer
-    print("-" * 60)
-    update = data.get('update_counter', 0)
-    valid = "✓" if data.get('data_valid', 0) else "✗"
-    print(f"  Update #{update} | Data valid: {valid} | {datetime.now().strftime('%H:%M:%S')}")
-    print("  Press Ctrl+C to exit")
-    print("=" * 60)
+    out.append("-" * 60)
+    update = get('update_counter', 0)
+    valid = "✓" if get('data_valid', 0) else "✗"
+    out.append(f"  Update #{update} | Data valid: {valid} | {datetime.now().strftime('%H:%M:%S')}")
+    out.append("  Press Ctrl+C to exit")
+    out.append("=" * 60)
+
+    # Emit the whole frame with one write. The leading escape sequence clears
+    # the screen (remove it if it doesn't work on your terminal)
+    sys.stdout.write("\033[H\033[J" + "\n".join(out) + "\n")
+    sys.stdout.flush()
 
 
 def main():
@@ -162,13 +185,13 @@ def main():
     print()
 
     sock = connect_to_aerofly()
-    buffer = ""
+    buffer = bytearray()
 
     try:
         while True:
             # Receive data
             try:
-                data = sock.recv(4096).decode('utf-8')
+                data = sock.recv(RECV_CHUNK_BYTES)
                 if not data:
                     print("Connection closed by server.")
                     break
@@ -176,23 +199,26 @@ def main():
             except socket.timeout:
                 continue
 
-            # Process complete JSON lines
-            while '\n' in buffer:
-                line, buffer = buffer.split('\n', 1)
-                line = line.strip()
+            # Process complete JSON lines (raw bytes; the partial tail stays buffered)
+            start = 0
+            while (idx := buffer.find(b'\n', start)) != -1:
+                line = bytes(buffer[start:idx]).strip()
+                start = idx + 1
 
                 if not line:
                     continue
 
                 try:
-                    flight_data = json.loads(line)
-                    display_flight_data(flight_data)
-                except json.JSONDecodeError as e:
+                    flight_data = parse_json(line)
+                except ValueError as e:
                     print(f"Error parsing JSON: {e}")
                     continue
 
-            # Small pause to avoid CPU saturation
-            time.sleep(0.05)
+                display_flight_data(flight_data)
+                # Release the document before a simdjson parser is reused
+                del flight_data
+
+            del buffer[:start]
 
     except KeyboardInterrupt:
         print("\n\nDisconnecting...")
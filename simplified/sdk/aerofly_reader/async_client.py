@@ -5,9 +5,17 @@ Asynchronous TCP client for connecting to AeroflyReader DLL.
 """
 
 import asyncio
-import json
+import errno
+import socket
 import logging
-from typing import AsyncIterator, Optional, Callable, Awaitable
+from typing import Any, AsyncIterator, List, Optional, Callable, Awaitable, Tuple, cast
+
+json_loads: Callable[[Any], Any]
+try:
+    # orjson is optional; it decodes frames several times faster than json
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 from .models import FlightData
 from .exceptions import (
@@ -20,6 +28,28 @@ from .exceptions import (
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_TIMEOUT = 5.0
+# Largest chunk taken from the StreamReader per read
+BUFFER_SIZE = 65536
+# Longest JSON line the client will buffer
+LINE_LIMIT = 1 << 20
+# Kernel receive buffer, large enough to hold a burst of frames
+SOCKET_RCVBUF = 262144
+# Upper bound for the exponential reconnect backoff (seconds)
+MAX_RECONNECT_DELAY = 30.0
+# errno values meaning "nothing is listening" (Winsock reports its own code)
+REFUSED_ERRNOS = (errno.ECONNREFUSED,) + (
+    (errno.WSAECONNREFUSED,) if hasattr(errno, 'WSAECONNREFUSED') else ()
+)
+# Frames queued per subscriber before the oldest are dropped
+SUBSCRIBER_QUEUE_SIZE = 16
+
+# _read_raw() status codes; errors become exceptions only where they propagate
+_OK = 0
+_TIMEOUT = 1
+_DISCONNECTED = 2
+_BAD_JSON = 3
+
 
 class AsyncAeroflyClient:
     """Asynchronous TCP client for AeroflyReader DLL.
@@ -45,14 +75,20 @@ class AsyncAeroflyClient:
         port: Server port (default: 12345)
         timeout: Connection/read timeout in seconds (default: 5.0)
         auto_reconnect: Automatically reconnect on disconnect (default: True)
-        reconnect_delay: Delay between reconnection attempts (default: 2.0)
+        reconnect_delay: Base delay between reconnection attempts (default: 2.0).
+            The first attempt is immediate, then the delay doubles per attempt
+            up to MAX_RECONNECT_DELAY.
         max_reconnect_attempts: Maximum reconnection attempts (default: 5)
+        reuse_frame: Update and return the same FlightData object on every read
+            instead of creating a new one (default: False). Only for consumers
+            that are done with a frame before reading the next one.
     """
 
     DEFAULT_HOST = 'localhost'
     DEFAULT_PORT = 12345
-    DEFAULT_TIMEOUT = 5.0
-    BUFFER_SIZE = 8192
+    DEFAULT_TIMEOUT = DEFAULT_TIMEOUT
+    BUFFER_SIZE = BUFFER_SIZE
+    LINE_LIMIT = LINE_LIMIT
 
     def __init__(
         self,
@@ -62,6 +98,7 @@ class AsyncAeroflyClient:
         auto_reconnect: bool = True,
         reconnect_delay: float = 2.0,
         max_reconnect_attempts: int = 5,
+        reuse_frame: bool = False,
     ):
         self.host = host
         self.port = port
@@ -69,17 +106,21 @@ class AsyncAeroflyClient:
         self.auto_reconnect = auto_reconnect
         self.reconnect_delay = reconnect_delay
         self.max_reconnect_attempts = max_reconnect_attempts
+        # With reuse_frame, read() updates and returns this one frame
+        self._frame: Optional[FlightData] = FlightData.empty() if reuse_frame else None
 
         self._reader: Optional[asyncio.StreamReader] = None
         self._writer: Optional[asyncio.StreamWriter] = None
-        self._buffer: str = ""
-        self._connected: bool = False
+        # Received bytes not yet returned as frames
+        self._buffer = bytearray()
+        # Plain attribute rather than a property: read() checks it per frame.
+        # Set by connect(), cleared by _cleanup().
+        self.is_connected: bool = False
         self._reconnect_count: int = 0
 
-    @property
-    def is_connected(self) -> bool:
-        """Check if client is currently connected."""
-        return self._connected and self._reader is not None
+        # subscribe() fan-out: one pump task reads, every subscriber has a queue
+        self._subscribers: List[asyncio.Queue] = []
+        self._pump_task: Optional[asyncio.Task] = None
 
     async def connect(self) -> None:
         """Connect to the AeroflyReader TCP server.
@@ -87,19 +128,23 @@ class AsyncAeroflyClient:
         Raises:
             ConnectionError: If connection cannot be established
         """
-        if self._connected:
+        if self.is_connected:
             return
 
-        logger.info(f"Connecting to {self.host}:{self.port}...")
+        logger.info("Connecting to %s:%s...", self.host, self.port)
 
         try:
             self._reader, self._writer = await asyncio.wait_for(
                 asyncio.open_connection(self.host, self.port),
                 timeout=self.timeout
             )
-            self._connected = True
+            # Latency over throughput: no Nagle delay, and room for bursts
+            sock = self._writer.get_extra_info('socket')
+            if sock is not None:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_RCVBUF)
+            self.is_connected = True
             self._reconnect_count = 0
-            self._buffer = ""
             logger.info("Connected successfully")
 
         except asyncio.TimeoutError:
@@ -110,7 +155,7 @@ class AsyncAeroflyClient:
             )
         except OSError as e:
             await self._cleanup()
-            if "refused" in str(e).lower() or e.errno == 111:
+            if e.errno in REFUSED_ERRNOS:
                 raise ConnectionError(
                     f"Connection refused at {self.host}:{self.port}. "
                     "Make sure AeroflyReader.dll is loaded in Aerofly FS4."
@@ -119,6 +164,12 @@ class AsyncAeroflyClient:
 
     async def disconnect(self) -> None:
         """Disconnect from the server."""
+        if self._pump_task is not None:
+            self._pump_task.cancel()
+            self._pump_task = None
+            # None ends every subscribe() iterator
+            for queue in self._subscribers:
+                _offer(queue, None)
         if self._writer:
             logger.info("Disconnecting...")
             await self._cleanup()
@@ -134,8 +185,8 @@ class AsyncAeroflyClient:
                 pass
         self._reader = None
         self._writer = None
-        self._connected = False
-        self._buffer = ""
+        self.is_connected = False
+        self._buffer.clear()
 
     async def _try_reconnect(self) -> bool:
         """Attempt to reconnect to the server.
@@ -147,19 +198,23 @@ class AsyncAeroflyClient:
             return False
 
         if self.max_reconnect_attempts > 0 and self._reconnect_count >= self.max_reconnect_attempts:
-            logger.error(f"Max reconnection attempts ({self.max_reconnect_attempts}) reached")
+            logger.error("Max reconnection attempts (%d) reached", self.max_reconnect_attempts)
             return False
 
         self._reconnect_count += 1
-        logger.info(f"Reconnection attempt {self._reconnect_count}...")
+        logger.info("Reconnection attempt %d...", self._reconnect_count)
 
-        await asyncio.sleep(self.reconnect_delay)
+        # Exponential backoff; the first retry is immediate since a brief
+        # network blip usually leaves the server reachable
+        if self._reconnect_count > 1:
+            delay = self.reconnect_delay * (2 ** min(self._reconnect_count - 2, 16))
+            await asyncio.sleep(min(delay, MAX_RECONNECT_DELAY))
 
         try:
             await self.connect()
             return True
         except ConnectionError as e:
-            logger.warning(f"Reconnection failed: {e}")
+            logger.warning("Reconnection failed: %s", e)
             return False
 
     async def read(self) -> FlightData:
@@ -179,43 +234,86 @@ class AsyncAeroflyClient:
         if not self.is_connected:
             raise NotConnectedError("Not connected. Call connect() first.")
 
+        status, payload = await self._read_raw()
+        if status == _OK:
+            return cast(FlightData, payload)
+        raise self._error_for(status, payload)
+
+    async def _read_raw(self) -> Tuple[int, Any]:
+        """Read the next frame without raising for stream errors.
+
+        Returns:
+            (_OK, FlightData), (_TIMEOUT, None), (_DISCONNECTED, message)
+            or (_BAD_JSON, decode error)
+        """
+        # Bound once; rebound only when a reconnect replaces the reader
+        buf = self._buffer
+        reader_read = self._reader.read
+        wait_for = asyncio.wait_for
+        timeout = self.timeout
+        from_json = FlightData.from_json
+        frame = self._frame
+
         while True:
-            # Check if we have a complete line in buffer
-            if '\n' in self._buffer:
-                line, self._buffer = self._buffer.split('\n', 1)
-                line = line.strip()
+            # Return every complete line already received before awaiting
+            # more data: a burst of frames that arrived together costs one
+            # wait_for() and event loop wakeup, not one per frame
+            nl = buf.find(b'\n')
+            if nl >= 0:
+                # One JSON object per line; only a '\r' before the '\n' needs
+                # trimming (the decoders accept any other surrounding whitespace)
+                end = nl - 1 if nl and buf[nl - 1] == 13 else nl
+                line = buf[:end]
+                del buf[:nl + 1]
 
                 if line:
                     try:
-                        data = json.loads(line)
-                        return FlightData.from_json(data)
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"Invalid JSON received: {e}")
-                        raise DataError(f"Invalid JSON data: {e}")
+                        data = json_loads(line)
+                        if frame is not None:
+                            frame.update_from_json(data)
+                            return _OK, frame
+                        return _OK, from_json(data)
+                    except ValueError as e:
+                        # json.JSONDecodeError, orjson.JSONDecodeError and
+                        # UnicodeDecodeError are all ValueErrors
+                        logger.warning("Invalid JSON received: %s", e)
+                        return _BAD_JSON, e
+                continue
+
+            if len(buf) > self.LINE_LIMIT:
+                # Discard the oversized line so the next read resynchronizes
+                buf.clear()
+                return _BAD_JSON, f"line longer than {self.LINE_LIMIT} bytes"
 
             # Receive more data
             try:
-                chunk = await asyncio.wait_for(
-                    self._reader.read(self.BUFFER_SIZE),
-                    timeout=self.timeout
-                )
-
-                if not chunk:
-                    # Server closed connection
-                    await self._cleanup()
-                    if await self._try_reconnect():
-                        continue
-                    raise DisconnectedError("Server closed connection")
-
-                self._buffer += chunk.decode('utf-8')
-
+                chunk = await wait_for(reader_read(self.BUFFER_SIZE), timeout=timeout)
             except asyncio.TimeoutError:
-                raise TimeoutError(f"No data received within {self.timeout} seconds")
+                return _TIMEOUT, None
             except OSError as e:
                 await self._cleanup()
                 if await self._try_reconnect():
+                    reader_read = self._reader.read
+                    continue
+                return _DISCONNECTED, f"Connection lost: {e}"
+
+            if not chunk:
+                # Server closed connection (a partial last line is dropped)
+                await self._cleanup()
+                if await self._try_reconnect():
+                    reader_read = self._reader.read
                     continue
-                raise DisconnectedError(f"Connection lost: {e}")
+                return _DISCONNECTED, "Server closed connection"
+
+            buf += chunk
+
+    def _error_for(self, status: int, payload: Any) -> Exception:
+        """Build the exception read() raises for a _read_raw() error status."""
+        if status == _TIMEOUT:
+            return TimeoutError(f"No data received within {self.timeout} seconds")
+        if status == _DISCONNECTED:
+            return DisconnectedError(payload)
+        return DataError(f"Invalid JSON data: {payload}")
 
     async def stream(
         self,
@@ -244,25 +342,103 @@ class AsyncAeroflyClient:
         frame_count = 0
 
         while max_frames is None or frame_count < max_frames:
-            try:
-                yield await self.read()
+            if not self.is_connected:
+                raise NotConnectedError("Not connected. Call connect() first.")
+
+            # Status codes instead of exceptions, so skipping a bad frame or
+            # recovering from a dropped connection raises nothing
+            status, payload = await self._read_raw()
+            if status == _OK:
+                yield payload
                 frame_count += 1
+                continue
 
-            except (DisconnectedError, TimeoutError) as e:
-                if on_error and await on_error(e):
-                    if await self._try_reconnect():
-                        continue
-                raise
-
-            except DataError as e:
-                if on_error:
-                    if await on_error(e):
-                        continue
-                    else:
-                        raise
-                logger.warning(f"Skipping invalid frame: {e}")
+            if status == _BAD_JSON and not on_error:
+                logger.warning("Skipping invalid frame: Invalid JSON data: %s", payload)
                 continue
 
+            error = self._error_for(status, payload)
+            if on_error and await on_error(error):
+                if status == _BAD_JSON:
+                    continue
+                if await self._try_reconnect():
+                    continue
+            raise error
+
+    async def subscribe(
+        self,
+        maxsize: int = SUBSCRIBER_QUEUE_SIZE,
+    ) -> AsyncIterator[FlightData]:
+        """Receive frames alongside other consumers sharing this connection.
+
+        The first subscriber starts a background task that reads frames and
+        puts each one on every subscriber's queue, so N consumers (chart,
+        HUD, logger...) share one socket and one decode per frame. A slow
+        subscriber loses its oldest queued frames, never the newest.
+
+        Stream errors (failed connect, timeout, lost connection) end every
+        subscription by raising in each iterator; invalid frames are skipped.
+        Do not combine with ``reuse_frame``: all queued frames would be the
+        same object.
+
+        Args:
+            maxsize: Frames queued for this subscriber before the oldest
+                are dropped
+
+        Yields:
+            FlightData objects
+
+        Example:
+            >>> async def hud(client):
+            ...     async for flight in client.subscribe():
+            ...         print(f"Alt: {flight.position.altitude_ft:.0f} ft")
+            >>>
+            >>> await asyncio.gather(hud(client), logger(client))
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self._subscribers.append(queue)
+        try:
+            # Claimed before any await, so concurrent first subscribers
+            # cannot each start a pump; the pump connects if needed
+            if self._pump_task is None or self._pump_task.done():
+                self._pump_task = asyncio.ensure_future(self._pump())
+
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            self._subscribers.remove(queue)
+            if not self._subscribers and self._pump_task is not None:
+                self._pump_task.cancel()
+                self._pump_task = None
+
+    async def _pump(self) -> None:
+        """Read frames and fan them out to every subscriber queue."""
+        try:
+            if not self.is_connected:
+                await self.connect()
+            while self._subscribers:
+                status, payload = await self._read_raw()
+                if status == _OK:
+                    for queue in self._subscribers:
+                        _offer(queue, payload)
+                elif status == _BAD_JSON:
+                    logger.warning("Skipping invalid frame: Invalid JSON data: %s", payload)
+                else:
+                    error = self._error_for(status, payload)
+                    for queue in self._subscribers:
+                        _offer(queue, error)
+                    return
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            for queue in self._subscribers:
+                _offer(queue, e)
+
     async def read_one(self) -> FlightData:
         """Connect, read a single frame, and disconnect.
 
@@ -292,6 +468,13 @@ class AsyncAeroflyClient:
         return f"AsyncAeroflyClient({self.host}:{self.port}, {status})"
 
 
+def _offer(queue: asyncio.Queue, item: Any) -> None:
+    """Put an item on a subscriber queue, dropping the oldest one if it is full."""
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(item)
+
+
 async def async_connect(
     host: str = AsyncAeroflyClient.DEFAULT_HOST,
     port: int = AsyncAeroflyClient.DEFAULT_PORT,
@@ -4,11 +4,21 @@ Aerofly Reader SDK - TCP Client
 Synchronous TCP client for connecting to AeroflyReader DLL.
 """
 
+import errno
 import socket
-import json
 import time
 import logging
-from typing import Iterator, Optional, Callable
+from typing import Any, Iterator, Optional, Callable, Tuple, cast
+
+json_loads: Callable[[Any], Any]
+try:
+    # orjson is optional; it decodes frames several times faster than json
+    # and can parse straight from a memoryview of the receive buffer
+    from orjson import loads as json_loads
+    LOADS_MEMORYVIEW = True
+except ImportError:
+    from json import loads as json_loads
+    LOADS_MEMORYVIEW = False
 
 from .models import FlightData
 from .exceptions import (
@@ -21,6 +31,24 @@ from .exceptions import (
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_TIMEOUT = 5.0
+# Initial size of the receive buffer (grows if a single line does not fit)
+BUFFER_SIZE = 65536
+# Kernel receive buffer, large enough to hold a burst of frames
+SOCKET_RCVBUF = 262144
+# Upper bound for the exponential reconnect backoff (seconds)
+MAX_RECONNECT_DELAY = 30.0
+# errno values meaning "nothing is listening" (Winsock reports its own code)
+REFUSED_ERRNOS = (errno.ECONNREFUSED,) + (
+    (errno.WSAECONNREFUSED,) if hasattr(errno, 'WSAECONNREFUSED') else ()
+)
+
+# _read_raw() status codes; errors become exceptions only where they propagate
+_OK = 0
+_TIMEOUT = 1
+_DISCONNECTED = 2
+_BAD_JSON = 3
+
 
 class AeroflyClient:
     """Synchronous TCP client for AeroflyReader DLL.
@@ -49,14 +77,19 @@ class AeroflyClient:
         port: Server port (default: 12345)
         timeout: Socket timeout in seconds (default: 5.0)
         auto_reconnect: Automatically reconnect on disconnect (default: True)
-        reconnect_delay: Delay between reconnection attempts (default: 2.0)
+        reconnect_delay: Base delay between reconnection attempts (default: 2.0).
+            The first attempt is immediate, then the delay doubles per attempt
+            up to MAX_RECONNECT_DELAY.
         max_reconnect_attempts: Maximum reconnection attempts (default: 5, 0 = infinite)
+        reuse_frame: Update and return the same FlightData object on every read
+            instead of creating a new one (default: False). Only for consumers
+            that are done with a frame before reading the next one.
     """
 
     DEFAULT_HOST = 'localhost'
     DEFAULT_PORT = 12345
-    DEFAULT_TIMEOUT = 5.0
-    BUFFER_SIZE = 8192
+    DEFAULT_TIMEOUT = DEFAULT_TIMEOUT
+    BUFFER_SIZE = BUFFER_SIZE
 
     def __init__(
         self,
@@ -66,6 +99,7 @@ class AeroflyClient:
         auto_reconnect: bool = True,
         reconnect_delay: float = 2.0,
         max_reconnect_attempts: int = 5,
+        reuse_frame: bool = False,
     ):
         self.host = host
         self.port = port
@@ -73,35 +107,42 @@ class AeroflyClient:
         self.auto_reconnect = auto_reconnect
         self.reconnect_delay = reconnect_delay
         self.max_reconnect_attempts = max_reconnect_attempts
+        # With reuse_frame, read() updates and returns this one frame
+        self._frame: Optional[FlightData] = FlightData.empty() if reuse_frame else None
 
         self._socket: Optional[socket.socket] = None
-        self._buffer: str = ""
-        self._connected: bool = False
+        # Receive buffer reused for every recv_into(); complete lines are
+        # taken from _rx_start and new data lands at _rx_end
+        self._rx_buf = bytearray(self.BUFFER_SIZE)
+        self._rx_view = memoryview(self._rx_buf)
+        self._rx_start = 0
+        self._rx_end = 0
+        # Plain attribute rather than a property: read() checks it per frame.
+        # Set by connect(), cleared by _cleanup().
+        self.is_connected: bool = False
         self._reconnect_count: int = 0
 
-    @property
-    def is_connected(self) -> bool:
-        """Check if client is currently connected."""
-        return self._connected and self._socket is not None
-
     def connect(self) -> None:
         """Connect to the AeroflyReader TCP server.
 
         Raises:
             ConnectionError: If connection cannot be established
         """
-        if self._connected:
+        if self.is_connected:
             return
 
-        logger.info(f"Connecting to {self.host}:{self.port}...")
+        logger.info("Connecting to %s:%s...", self.host, self.port)
 
         try:
             self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            # Latency over throughput: no Nagle delay, and room for bursts.
+            # SO_RCVBUF is set before connect() so it applies to the handshake.
+            self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_RCVBUF)
             self._socket.settimeout(self.timeout)
             self._socket.connect((self.host, self.port))
-            self._connected = True
+            self.is_connected = True
             self._reconnect_count = 0
-            self._buffer = ""
             logger.info("Connected successfully")
 
         except socket.timeout:
@@ -112,7 +153,7 @@ class AeroflyClient:
             )
         except socket.error as e:
             self._cleanup()
-            if e.errno == 111 or "refused" in str(e).lower():
+            if e.errno in REFUSED_ERRNOS:
                 raise ConnectionError(
                     f"Connection refused at {self.host}:{self.port}. "
                     "Make sure AeroflyReader.dll is loaded in Aerofly FS4."
@@ -134,8 +175,8 @@ class AeroflyClient:
             except Exception:
                 pass
         self._socket = None
-        self._connected = False
-        self._buffer = ""
+        self.is_connected = False
+        self._rx_start = self._rx_end = 0
 
     def _try_reconnect(self) -> bool:
         """Attempt to reconnect to the server.
@@ -147,19 +188,23 @@ class AeroflyClient:
             return False
 
         if self.max_reconnect_attempts > 0 and self._reconnect_count >= self.max_reconnect_attempts:
-            logger.error(f"Max reconnection attempts ({self.max_reconnect_attempts}) reached")
+            logger.error("Max reconnection attempts (%d) reached", self.max_reconnect_attempts)
             return False
 
         self._reconnect_count += 1
-        logger.info(f"Reconnection attempt {self._reconnect_count}...")
+        logger.info("Reconnection attempt %d...", self._reconnect_count)
 
-        time.sleep(self.reconnect_delay)
+        # Exponential backoff; the first retry is immediate since a brief
+        # network blip usually leaves the server reachable
+        if self._reconnect_count > 1:
+            delay = self.reconnect_delay * (2 ** min(self._reconnect_count - 2, 16))
+            time.sleep(min(delay, MAX_RECONNECT_DELAY))
 
         try:
             self.connect()
             return True
         except ConnectionError as e:
-            logger.warning(f"Reconnection failed: {e}")
+            logger.warning("Reconnection failed: %s", e)
             return False
 
     def read(self) -> FlightData:
@@ -179,39 +224,106 @@ class AeroflyClient:
         if not self.is_connected:
             raise NotConnectedError("Not connected. Call connect() first.")
 
-        while True:
-            # Check if we have a complete line in buffer
-            if '\n' in self._buffer:
-                line, self._buffer = self._buffer.split('\n', 1)
-                line = line.strip()
+        status, payload = self._read_raw()
+        if status == _OK:
+            return cast(FlightData, payload)
+        raise self._error_for(status, payload)
+
+    def _read_raw(self) -> Tuple[int, Any]:
+        """Read the next frame without raising for stream errors.
+
+        Returns:
+            (_OK, FlightData), (_TIMEOUT, None), (_DISCONNECTED, message)
+            or (_BAD_JSON, decode error)
+        """
+        buf = self._rx_buf
+        from_json = FlightData.from_json
+        frame = self._frame
 
-                if line:
+        while True:
+            # Return the next complete line already buffered before receiving
+            # more; lines stay bytes and the JSON decoder handles the UTF-8
+            nl = buf.find(b'\n', self._rx_start, self._rx_end)
+            if nl >= 0:
+                start = self._rx_start
+                self._rx_start = nl + 1
+                # One JSON object per line; only a '\r' before the '\n' needs
+                # trimming (the decoders accept any other surrounding whitespace)
+                if nl > start and buf[nl - 1] == 13:
+                    nl -= 1
+
+                if nl > start:
                     try:
-                        data = json.loads(line)
-                        return FlightData.from_json(data)
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"Invalid JSON received: {e}")
-                        raise DataError(f"Invalid JSON data: {e}")
+                        if LOADS_MEMORYVIEW:
+                            # No copy of the line; the view is released before
+                            # the buffer can be resized
+                            with self._rx_view[start:nl] as line:
+                                data = json_loads(line)
+                        else:
+                            data = json_loads(buf[start:nl])
+                        if frame is not None:
+                            frame.update_from_json(data)
+                            return _OK, frame
+                        return _OK, from_json(data)
+                    except ValueError as e:
+                        # json.JSONDecodeError, orjson.JSONDecodeError and
+                        # UnicodeDecodeError are all ValueErrors
+                        logger.warning("Invalid JSON received: %s", e)
+                        return _BAD_JSON, e
+                continue
 
             # Receive more data
             try:
-                chunk = self._socket.recv(self.BUFFER_SIZE)
-                if not chunk:
-                    # Server closed connection
-                    self._cleanup()
-                    if self._try_reconnect():
-                        continue
-                    raise DisconnectedError("Server closed connection")
-
-                self._buffer += chunk.decode('utf-8')
-
+                received = self._recv()
             except socket.timeout:
-                raise TimeoutError(f"No data received within {self.timeout} seconds")
+                return _TIMEOUT, None
             except socket.error as e:
                 self._cleanup()
                 if self._try_reconnect():
                     continue
-                raise DisconnectedError(f"Connection lost: {e}")
+                return _DISCONNECTED, f"Connection lost: {e}"
+
+            if not received:
+                # Server closed connection (a partial last line is dropped)
+                self._cleanup()
+                if self._try_reconnect():
+                    continue
+                return _DISCONNECTED, "Server closed connection"
+
+    def _error_for(self, status: int, payload: Any) -> Exception:
+        """Build the exception read() raises for a _read_raw() error status."""
+        if status == _TIMEOUT:
+            return TimeoutError(f"No data received within {self.timeout} seconds")
+        if status == _DISCONNECTED:
+            return DisconnectedError(payload)
+        return DataError(f"Invalid JSON data: {payload}")
+
+    def _recv(self) -> int:
+        """Receive into the free tail of the buffer without allocating.
+
+        Returns:
+            Number of bytes received (0 when the server closed the connection)
+        """
+        buf = self._rx_buf
+        start, end = self._rx_start, self._rx_end
+        if start == end:
+            start = end = 0
+        elif end == len(buf):
+            if start:
+                # Move the partial line to the front of the buffer
+                buf[:end - start] = buf[start:end]
+                end -= start
+                start = 0
+            else:
+                # A single line fills the whole buffer: grow it in place
+                self._rx_view.release()
+                buf.extend(bytes(len(buf)))
+                self._rx_view = memoryview(buf)
+        self._rx_start = start
+
+        received = self._socket.recv_into(self._rx_view[end:])
+        self._rx_end = end + received
+        return received
 
     def stream(
         self,
@@ -242,27 +354,31 @@ class AeroflyClient:
         frame_count = 0
 
         while max_frames is None or frame_count < max_frames:
-            try:
-                yield self.read()
+            if not self.is_connected:
+                raise NotConnectedError("Not connected. Call connect() first.")
+
+            # Status codes instead of exceptions, so skipping a bad frame or
+            # recovering from a dropped connection raises nothing
+            status, payload = self._read_raw()
+            if status == _OK:
+                yield payload
                 frame_count += 1
+                continue
 
-            except (DisconnectedError, TimeoutError) as e:
-                if on_error and on_error(e):
-                    # User wants to continue, try to reconnect
-                    if self._try_reconnect():
-                        continue
-                raise
-
-            except DataError as e:
-                if on_error:
-                    if on_error(e):
-                        continue  # Skip bad frame
-                    else:
-                        raise
+            if status == _BAD_JSON and not on_error:
                 # By default, skip bad frames and continue
-                logger.warning(f"Skipping invalid frame: {e}")
+                logger.warning("Skipping invalid frame: Invalid JSON data: %s", payload)
                 continue
 
+            error = self._error_for(status, payload)
+            if on_error and on_error(error):
+                if status == _BAD_JSON:
+                    continue  # Skip bad frame
+                # User wants to continue, try to reconnect
+                if self._try_reconnect():
+                    continue
+            raise error
+
     def read_one(self) -> FlightData:
         """Connect, read a single frame, and disconnect.
 
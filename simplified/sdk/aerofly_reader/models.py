@@ -5,21 +5,41 @@ Typed dataclasses for flight data with automatic unit conversions.
 """
 
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import math
 
 from .units import (
+    MS_TO_KNOTS,
+    MS_TO_FPM,
+    RAD_TO_DEG,
     ms_to_knots,
     ms_to_fpm,
     radians_to_degrees,
-    normalize_heading,
     normalize_longitude,
 )
 
 
+class _Slotted:
+    """Base for the models: instances use __slots__ instead of a __dict__.
+
+    Frozen dataclasses cannot restore slotted state through setattr, so
+    pickling and copying go through these two methods instead.
+    """
+    __slots__: Tuple[str, ...] = ()
+
+    def __getstate__(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: tuple) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
 @dataclass(frozen=True)
-class Vector3D:
+class Vector3D(_Slotted):
     """3D vector for position, velocity, acceleration, etc."""
+    __slots__ = ('x', 'y', 'z')
+
     x: float
     y: float
     z: float
@@ -29,25 +49,27 @@ class Vector3D:
         """Create from dictionary with x, y, z keys."""
         if data is None:
             return cls(0.0, 0.0, 0.0)
-        return cls(
-            x=data.get('x', 0.0),
-            y=data.get('y', 0.0),
-            z=data.get('z', 0.0)
-        )
+        try:
+            # The DLL always sends all three components
+            return cls(data['x'], data['y'], data['z'])
+        except KeyError:
+            return cls(data.get('x', 0.0), data.get('y', 0.0), data.get('z', 0.0))
 
     @property
     def magnitude(self) -> float:
         """Calculate vector magnitude."""
-        return math.sqrt(self.x**2 + self.y**2 + self.z**2)
+        return math.hypot(self.x, self.y, self.z)
 
 
 @dataclass(frozen=True)
-class Position:
+class Position(_Slotted):
     """GPS position with automatic conversion to degrees.
 
     Raw values are in radians (latitude, longitude) and feet (altitude, height).
     Properties provide converted values in degrees with proper normalization.
     """
+    __slots__ = ('latitude_rad', 'longitude_rad', 'altitude_ft', 'height_agl_ft')
+
     latitude_rad: float
     longitude_rad: float
     altitude_ft: float
@@ -79,11 +101,16 @@ class Position:
 
 
 @dataclass(frozen=True)
-class Speeds:
+class Speeds(_Slotted):
     """Aircraft speeds with automatic conversion to knots/fpm.
 
     Raw values are in m/s. Properties provide converted values.
     """
+    __slots__ = (
+        'indicated_airspeed_ms', 'ground_speed_ms', 'vertical_speed_ms', 'mach_number',
+        'angle_of_attack_rad',
+    )
+
     indicated_airspeed_ms: float
     ground_speed_ms: float
     vertical_speed_ms: float
@@ -137,11 +164,13 @@ class Speeds:
 
 
 @dataclass(frozen=True)
-class Orientation:
+class Orientation(_Slotted):
     """Aircraft orientation with automatic conversion to degrees.
 
     Raw values are in radians. Properties provide degrees.
     """
+    __slots__ = ('pitch_rad', 'bank_rad', 'true_heading_rad', 'magnetic_heading_rad')
+
     pitch_rad: float
     bank_rad: float
     true_heading_rad: float
@@ -165,12 +194,12 @@ class Orientation:
     @property
     def true_heading(self) -> float:
         """True heading in degrees (0-360)."""
-        return normalize_heading(radians_to_degrees(self.true_heading_rad))
+        return self.true_heading_rad * RAD_TO_DEG % 360
 
     @property
     def magnetic_heading(self) -> float:
         """Magnetic heading in degrees (0-360)."""
-        return normalize_heading(radians_to_degrees(self.magnetic_heading_rad))
+        return self.magnetic_heading_rad * RAD_TO_DEG % 360
 
     @property
     def heading(self) -> float:
@@ -179,8 +208,10 @@ class Orientation:
 
 
 @dataclass(frozen=True)
-class EngineState:
+class EngineState(_Slotted):
     """Engine state for a single engine."""
+    __slots__ = ('running', 'throttle')
+
     running: bool
     throttle: float  # 0.0 to 1.0
 
@@ -191,8 +222,10 @@ class EngineState:
 
 
 @dataclass(frozen=True)
-class Engines:
+class Engines(_Slotted):
     """All engines state."""
+    __slots__ = ('engine1', 'engine2')
+
     engine1: EngineState
     engine2: EngineState
 
@@ -208,8 +241,10 @@ class Engines:
 
 
 @dataclass(frozen=True)
-class Autopilot:
+class Autopilot(_Slotted):
     """Autopilot state (read-only from DLL)."""
+    __slots__ = ('master', 'heading_rad', 'altitude_ft', 'vertical_speed_fpm')
+
     master: bool
     heading_rad: float
     altitude_ft: float
@@ -218,7 +253,7 @@ class Autopilot:
     @property
     def heading(self) -> float:
         """Selected heading in degrees (0-360)."""
-        return normalize_heading(radians_to_degrees(self.heading_rad))
+        return self.heading_rad * RAD_TO_DEG % 360
 
     @property
     def altitude(self) -> float:
@@ -232,8 +267,13 @@ class Autopilot:
 
 
 @dataclass(frozen=True)
-class Navigation:
+class Navigation(_Slotted):
     """Radio navigation frequencies."""
+    __slots__ = (
+        'nav1_frequency', 'nav2_frequency', 'com1_frequency', 'com2_frequency',
+        'selected_course_1_rad', 'selected_course_2_rad',
+    )
+
     nav1_frequency: float  # MHz
     nav2_frequency: float  # MHz
     com1_frequency: float  # MHz
@@ -244,17 +284,19 @@ class Navigation:
     @property
     def selected_course_1(self) -> float:
         """Selected course 1 in degrees."""
-        return normalize_heading(radians_to_degrees(self.selected_course_1_rad))
+        return self.selected_course_1_rad * RAD_TO_DEG % 360
 
     @property
     def selected_course_2(self) -> float:
         """Selected course 2 in degrees."""
-        return normalize_heading(radians_to_degrees(self.selected_course_2_rad))
+        return self.selected_course_2_rad * RAD_TO_DEG % 360
 
 
 @dataclass(frozen=True)
-class VSpeeds:
+class VSpeeds(_Slotted):
     """V-speeds for the current aircraft (in m/s from DLL)."""
+    __slots__ = ('vs0_ms', 'vs1_ms', 'vfe_ms', 'vno_ms', 'vne_ms')
+
     vs0_ms: float  # Stall speed (flaps extended)
     vs1_ms: float  # Stall speed (clean)
     vfe_ms: float  # Max flaps extended speed
@@ -288,8 +330,13 @@ class VSpeeds:
 
 
 @dataclass(frozen=True)
-class AircraftInfo:
+class AircraftInfo(_Slotted):
     """Aircraft and airport information."""
+    __slots__ = (
+        'name', 'nearest_airport_id', 'nearest_airport_name', 'nearest_airport_elevation_ft',
+        'nearest_airport_latitude_rad', 'nearest_airport_longitude_rad',
+    )
+
     name: str
     nearest_airport_id: str
     nearest_airport_name: str
@@ -310,7 +357,7 @@ class AircraftInfo:
 
 
 @dataclass(frozen=True)
-class FlightData:
+class FlightData(_Slotted):
     """Complete flight data from AeroflyReader DLL.
 
     This is the main data structure returned by the client.
@@ -322,6 +369,13 @@ class FlightData:
         >>> print(f"Speed: {data.speeds.indicated_airspeed:.0f} kts")
         >>> print(f"Heading: {data.orientation.heading:.0f}°")
     """
+    __slots__ = (
+        'timestamp', 'update_counter', 'data_valid', 'update_hz', 'schema', 'version', 'position',
+        'speeds', 'orientation', 'on_ground', 'gear', 'flaps', 'throttle', 'parking_brake',
+        'engines', 'autopilot', 'navigation', 'vspeeds', 'world_position', 'velocity',
+        'acceleration', 'wind', 'aircraft',
+    )
+
     # Metadata
     timestamp: int
     update_counter: int
@@ -392,140 +446,251 @@ class FlightData:
         Returns:
             FlightData instance with all fields populated
         """
-        # Position
+        # The schema is fixed, so fields are read by key with a bound get()
+        # and passed positionally in declaration order
+        get = data.get
+
         position = Position(
-            latitude_rad=data.get('latitude', 0.0),
-            longitude_rad=data.get('longitude', 0.0),
-            altitude_ft=data.get('altitude', 0.0),
-            height_agl_ft=data.get('height', 0.0),
+            get('latitude', 0.0),
+            get('longitude', 0.0),
+            get('altitude', 0.0),
+            get('height', 0.0),
         )
 
-        # Speeds
         speeds = Speeds(
-            indicated_airspeed_ms=data.get('indicated_airspeed', 0.0),
-            ground_speed_ms=data.get('ground_speed', 0.0),
-            vertical_speed_ms=data.get('vertical_speed', 0.0),
-            mach_number=data.get('mach_number', 0.0),
-            angle_of_attack_rad=data.get('angle_of_attack', 0.0),
+            get('indicated_airspeed', 0.0),
+            get('ground_speed', 0.0),
+            get('vertical_speed', 0.0),
+            get('mach_number', 0.0),
+            get('angle_of_attack', 0.0),
         )
 
-        # Orientation
         orientation = Orientation(
-            pitch_rad=data.get('pitch', 0.0),
-            bank_rad=data.get('bank', 0.0),
-            true_heading_rad=data.get('true_heading', 0.0),
-            magnetic_heading_rad=data.get('magnetic_heading', 0.0),
+            get('pitch', 0.0),
+            get('bank', 0.0),
+            get('true_heading', 0.0),
+            get('magnetic_heading', 0.0),
         )
 
-        # Engines
         engines = Engines(
-            engine1=EngineState(
-                running=data.get('engine_running_1', 0) > 0.5,
-                throttle=data.get('engine_throttle_1', 0.0),
-            ),
-            engine2=EngineState(
-                running=data.get('engine_running_2', 0) > 0.5,
-                throttle=data.get('engine_throttle_2', 0.0),
-            ),
+            EngineState(get('engine_running_1', 0) > 0.5, get('engine_throttle_1', 0.0)),
+            EngineState(get('engine_running_2', 0) > 0.5, get('engine_throttle_2', 0.0)),
         )
 
-        # Autopilot
         autopilot = Autopilot(
-            master=data.get('autopilot_master', 0) > 0.5,
-            heading_rad=data.get('autopilot_heading', 0.0),
-            altitude_ft=data.get('autopilot_altitude', 0.0),
-            vertical_speed_fpm=data.get('autopilot_vertical_speed', 0.0),
+            get('autopilot_master', 0) > 0.5,
+            get('autopilot_heading', 0.0),
+            get('autopilot_altitude', 0.0),
+            get('autopilot_vertical_speed', 0.0),
         )
 
-        # Navigation
         navigation = Navigation(
-            nav1_frequency=data.get('nav1_frequency', 0.0),
-            nav2_frequency=data.get('nav2_frequency', 0.0),
-            com1_frequency=data.get('com1_frequency', 0.0),
-            com2_frequency=data.get('com2_frequency', 0.0),
-            selected_course_1_rad=data.get('selected_course_1', 0.0),
-            selected_course_2_rad=data.get('selected_course_2', 0.0),
+            get('nav1_frequency', 0.0),
+            get('nav2_frequency', 0.0),
+            get('com1_frequency', 0.0),
+            get('com2_frequency', 0.0),
+            get('selected_course_1', 0.0),
+            get('selected_course_2', 0.0),
         )
 
-        # V-Speeds
         vspeeds = VSpeeds(
-            vs0_ms=data.get('vs0', 0.0),
-            vs1_ms=data.get('vs1', 0.0),
-            vfe_ms=data.get('vfe', 0.0),
-            vno_ms=data.get('vno', 0.0),
-            vne_ms=data.get('vne', 0.0),
+            get('vs0', 0.0),
+            get('vs1', 0.0),
+            get('vfe', 0.0),
+            get('vno', 0.0),
+            get('vne', 0.0),
         )
 
         # Physics vectors
-        world_position = Vector3D.from_dict(data.get('position'))
-        velocity = Vector3D.from_dict(data.get('velocity'))
-        acceleration = Vector3D.from_dict(data.get('acceleration'))
-        wind = Vector3D.from_dict(data.get('wind'))
+        vector = Vector3D.from_dict
+        world_position = vector(get('position'))
+        velocity = vector(get('velocity'))
+        acceleration = vector(get('acceleration'))
+        wind = vector(get('wind'))
 
-        # Aircraft info
         aircraft = AircraftInfo(
-            name=data.get('aircraft_name', 'Unknown'),
-            nearest_airport_id=data.get('nearest_airport_id', '----'),
-            nearest_airport_name=data.get('nearest_airport_name', 'Unknown'),
-            nearest_airport_elevation_ft=data.get('nearest_airport_elevation', 0.0),
-            nearest_airport_latitude_rad=data.get('nearest_airport_latitude', 0.0),
-            nearest_airport_longitude_rad=data.get('nearest_airport_longitude', 0.0),
+            get('aircraft_name', 'Unknown'),
+            get('nearest_airport_id', '----'),
+            get('nearest_airport_name', 'Unknown'),
+            get('nearest_airport_elevation', 0.0),
+            get('nearest_airport_latitude', 0.0),
+            get('nearest_airport_longitude', 0.0),
         )
 
         return cls(
-            # Metadata
-            timestamp=data.get('timestamp', 0),
-            update_counter=data.get('update_counter', 0),
-            data_valid=data.get('data_valid', 0) > 0,
-            update_hz=data.get('update_hz', 0.0),
-            schema=data.get('schema', 'aerofly-reader-telemetry'),
-            version=data.get('version', '0.0.0'),
+            # Metadata: timestamp, update_counter, data_valid, update_hz, schema, version
+            get('timestamp', 0),
+            get('update_counter', 0),
+            get('data_valid', 0) > 0,
+            get('update_hz', 0.0),
+            get('schema', 'aerofly-reader-telemetry'),
+            get('version', '0.0.0'),
             # Core
-            position=position,
-            speeds=speeds,
-            orientation=orientation,
-            # State
-            on_ground=data.get('on_ground', 0) > 0.5,
-            gear=data.get('gear', 0.0),
-            flaps=data.get('flaps', 0.0),
-            throttle=data.get('throttle', 0.0),
-            parking_brake=data.get('parking_brake', 0) > 0.5,
+            position,
+            speeds,
+            orientation,
+            # State: on_ground, gear, flaps, throttle, parking_brake
+            get('on_ground', 0) > 0.5,
+            get('gear', 0.0),
+            get('flaps', 0.0),
+            get('throttle', 0.0),
+            get('parking_brake', 0) > 0.5,
             # Systems
-            engines=engines,
-            autopilot=autopilot,
-            navigation=navigation,
-            vspeeds=vspeeds,
+            engines,
+            autopilot,
+            navigation,
+            vspeeds,
             # Physics
-            world_position=world_position,
-            velocity=velocity,
-            acceleration=acceleration,
-            wind=wind,
+            world_position,
+            velocity,
+            acceleration,
+            wind,
             # Info
-            aircraft=aircraft,
+            aircraft,
         )
 
+    @classmethod
+    def empty(cls) -> 'FlightData':
+        """Create a FlightData with every field at its default value."""
+        return cls.from_json({})
+
+    def update_from_json(self, data: Dict[str, Any]) -> None:
+        """Overwrite this frame and its components in place from a JSON dictionary.
+
+        Used by the clients' ``reuse_frame`` mode so that no objects are
+        allocated per frame. The models are frozen dataclasses, so this
+        bypasses the freeze: a frame updated this way must not be kept
+        across reads, used as a dict key or stored in a set.
+
+        Args:
+            data: Dictionary parsed from JSON
+        """
+        get = data.get
+        set_ = object.__setattr__
+
+        # Metadata
+        set_(self, 'timestamp', get('timestamp', 0))
+        set_(self, 'update_counter', get('update_counter', 0))
+        set_(self, 'data_valid', get('data_valid', 0) > 0)
+        set_(self, 'update_hz', get('update_hz', 0.0))
+        set_(self, 'schema', get('schema', 'aerofly-reader-telemetry'))
+        set_(self, 'version', get('version', '0.0.0'))
+
+        # Position
+        position = self.position
+        set_(position, 'latitude_rad', get('latitude', 0.0))
+        set_(position, 'longitude_rad', get('longitude', 0.0))
+        set_(position, 'altitude_ft', get('altitude', 0.0))
+        set_(position, 'height_agl_ft', get('height', 0.0))
+
+        # Speeds
+        speeds = self.speeds
+        set_(speeds, 'indicated_airspeed_ms', get('indicated_airspeed', 0.0))
+        set_(speeds, 'ground_speed_ms', get('ground_speed', 0.0))
+        set_(speeds, 'vertical_speed_ms', get('vertical_speed', 0.0))
+        set_(speeds, 'mach_number', get('mach_number', 0.0))
+        set_(speeds, 'angle_of_attack_rad', get('angle_of_attack', 0.0))
+
+        # Orientation
+        orientation = self.orientation
+        set_(orientation, 'pitch_rad', get('pitch', 0.0))
+        set_(orientation, 'bank_rad', get('bank', 0.0))
+        set_(orientation, 'true_heading_rad', get('true_heading', 0.0))
+        set_(orientation, 'magnetic_heading_rad', get('magnetic_heading', 0.0))
+
+        # State
+        set_(self, 'on_ground', get('on_ground', 0) > 0.5)
+        set_(self, 'gear', get('gear', 0.0))
+        set_(self, 'flaps', get('flaps', 0.0))
+        set_(self, 'throttle', get('throttle', 0.0))
+        set_(self, 'parking_brake', get('parking_brake', 0) > 0.5)
+
+        # Engines
+        engine1 = self.engines.engine1
+        set_(engine1, 'running', get('engine_running_1', 0) > 0.5)
+        set_(engine1, 'throttle', get('engine_throttle_1', 0.0))
+        engine2 = self.engines.engine2
+        set_(engine2, 'running', get('engine_running_2', 0) > 0.5)
+        set_(engine2, 'throttle', get('engine_throttle_2', 0.0))
+
+        # Autopilot
+        autopilot = self.autopilot
+        set_(autopilot, 'master', get('autopilot_master', 0) > 0.5)
+        set_(autopilot, 'heading_rad', get('autopilot_heading', 0.0))
+        set_(autopilot, 'altitude_ft', get('autopilot_altitude', 0.0))
+        set_(autopilot, 'vertical_speed_fpm', get('autopilot_vertical_speed', 0.0))
+
+        # Navigation
+        navigation = self.navigation
+        set_(navigation, 'nav1_frequency', get('nav1_frequency', 0.0))
+        set_(navigation, 'nav2_frequency', get('nav2_frequency', 0.0))
+        set_(navigation, 'com1_frequency', get('com1_frequency', 0.0))
+        set_(navigation, 'com2_frequency', get('com2_frequency', 0.0))
+        set_(navigation, 'selected_course_1_rad', get('selected_course_1', 0.0))
+        set_(navigation, 'selected_course_2_rad', get('selected_course_2', 0.0))
+
+        # V-Speeds
+        vspeeds = self.vspeeds
+        set_(vspeeds, 'vs0_ms', get('vs0', 0.0))
+        set_(vspeeds, 'vs1_ms', get('vs1', 0.0))
+        set_(vspeeds, 'vfe_ms', get('vfe', 0.0))
+        set_(vspeeds, 'vno_ms', get('vno', 0.0))
+        set_(vspeeds, 'vne_ms', get('vne', 0.0))
+
+        # Physics vectors
+        for vector, key in (
+            (self.world_position, 'position'),
+            (self.velocity, 'velocity'),
+            (self.acceleration, 'acceleration'),
+            (self.wind, 'wind'),
+        ):
+            values = get(key) or {}
+            set_(vector, 'x', values.get('x', 0.0))
+            set_(vector, 'y', values.get('y', 0.0))
+            set_(vector, 'z', values.get('z', 0.0))
+
+        # Aircraft info
+        aircraft = self.aircraft
+        set_(aircraft, 'name', get('aircraft_name', 'Unknown'))
+        set_(aircraft, 'nearest_airport_id', get('nearest_airport_id', '----'))
+        set_(aircraft, 'nearest_airport_name', get('nearest_airport_name', 'Unknown'))
+        set_(aircraft, 'nearest_airport_elevation_ft', get('nearest_airport_elevation', 0.0))
+        set_(aircraft, 'nearest_airport_latitude_rad', get('nearest_airport_latitude', 0.0))
+        set_(aircraft, 'nearest_airport_longitude_rad', get('nearest_airport_longitude', 0.0))
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary with converted units.
 
         Returns:
             Dictionary with all values in standard aviation units
         """
+        # Same results as the component properties, converted here in one
+        # frame instead of one or two helper calls per value
+        position = self.position
+        speeds = self.speeds
+        orientation = self.orientation
+        degrees = math.degrees
+
+        longitude = degrees(position.longitude_rad)
+        if longitude > 180:
+            longitude -= 360
+
         return {
             'timestamp': self.timestamp,
             'update_counter': self.update_counter,
             'data_valid': self.data_valid,
             'update_hz': self.update_hz,
-            'latitude': self.position.latitude,
-            'longitude': self.position.longitude,
-            'altitude_ft': self.position.altitude_ft,
-            'height_agl_ft': self.position.height_agl_ft,
-            'indicated_airspeed_kts': self.speeds.indicated_airspeed,
-            'ground_speed_kts': self.speeds.ground_speed,
-            'vertical_speed_fpm': self.speeds.vertical_speed,
-            'mach': self.speeds.mach_number,
-            'pitch_deg': self.orientation.pitch,
-            'bank_deg': self.orientation.bank,
-            'heading_deg': self.orientation.heading,
+            'latitude': degrees(position.latitude_rad),
+            'longitude': longitude,
+            'altitude_ft': position.altitude_ft,
+            'height_agl_ft': position.height_agl_ft,
+            'indicated_airspeed_kts': speeds.indicated_airspeed_ms * MS_TO_KNOTS,
+            'ground_speed_kts': speeds.ground_speed_ms * MS_TO_KNOTS,
+            'vertical_speed_fpm': speeds.vertical_speed_ms * MS_TO_FPM,
+            'mach': speeds.mach_number,
+            'pitch_deg': degrees(orientation.pitch_rad),
+            'bank_deg': degrees(orientation.bank_rad),
+            'heading_deg': degrees(orientation.magnetic_heading_rad) % 360,
             'on_ground': self.on_ground,
             'gear': self.gear,
             'flaps': self.flaps,
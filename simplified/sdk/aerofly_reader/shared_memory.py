@@ -8,7 +8,7 @@ Windows-only feature.
 import struct
 import logging
 import sys
-from typing import Optional
+from typing import Dict, Optional, Tuple, cast
 from dataclasses import dataclass
 
 from .models import FlightData, Position, Speeds, Orientation, Vector3D
@@ -18,6 +18,12 @@ from .exceptions import SharedMemoryError, NotConnectedError
 logger = logging.getLogger(__name__)
 
 
+# Native layout, as written by the DLL
+_DOUBLE = struct.Struct('d')
+_UINT64 = struct.Struct('Q')
+_UINT32 = struct.Struct('I')
+
+
 # Shared memory structure offsets and sizes
 # Based on AeroflyReaderData struct in aerofly_reader_dll.cpp
 
@@ -100,6 +106,15 @@ class MemoryLayout:
     TOTAL_SIZE = 1024
 
 
+# Everything before the strings: timestamp, data_valid, update_counter and
+# the 52 doubles from LATITUDE_OFFSET to NEAREST_AIRPORT_LONGITUDE_OFFSET
+_NUMERIC = struct.Struct('QII52d')
+assert _NUMERIC.size == MemoryLayout.AIRCRAFT_NAME_OFFSET
+
+# data_valid and update_counter
+_HEADER = struct.Struct('II')
+
+
 class SharedMemoryClient:
     """Shared memory client for direct access to flight data.
 
@@ -118,15 +133,27 @@ class SharedMemoryClient:
 
     Args:
         mapping_name: Name of the shared memory mapping (default: "AeroflyReaderData")
+        reuse_frame: Update and return the same FlightData object on every read
+            instead of creating a new one (default: False). Only for consumers
+            that are done with a frame before reading the next one.
     """
 
     DEFAULT_MAPPING_NAME = "AeroflyReaderData"
 
-    def __init__(self, mapping_name: str = DEFAULT_MAPPING_NAME):
+    def __init__(self, mapping_name: str = DEFAULT_MAPPING_NAME, reuse_frame: bool = False):
         self.mapping_name = mapping_name
+        # With reuse_frame, read() updates and returns this one frame
+        self._frame: Optional[FlightData] = None
+        if reuse_frame:
+            self._frame = FlightData.empty()
+            object.__setattr__(self._frame, 'version', '1.1.0')
         self._mmap = None
         self._connected = False
         self._layout = MemoryLayout()
+        self._strings: Dict[int, Tuple[bytes, str]] = {}
+        # update_counter of the last complete frame returned by read()
+        self._last_counter: Optional[int] = None
+        self._last_frame: Optional[FlightData] = None
 
     @property
     def is_connected(self) -> bool:
@@ -184,43 +211,52 @@ class SharedMemoryClient:
                 pass
         self._mmap = None
         self._connected = False
+        # Nothing cached from this mapping may outlive it
+        self._strings.clear()
+        self._last_counter = None
+        self._last_frame = None
+
+    # Scalars are unpacked straight out of the mapping at an absolute offset,
+    # with no seek() and no intermediate bytes object
 
     def _read_double(self, offset: int) -> float:
         """Read a double (8 bytes) from shared memory."""
-        self._mmap.seek(offset)
-        return struct.unpack('d', self._mmap.read(8))[0]
+        return cast(float, _DOUBLE.unpack_from(self._mmap, offset)[0])
 
     def _read_uint64(self, offset: int) -> int:
         """Read a uint64 (8 bytes) from shared memory."""
-        self._mmap.seek(offset)
-        return struct.unpack('Q', self._mmap.read(8))[0]
+        return cast(int, _UINT64.unpack_from(self._mmap, offset)[0])
 
     def _read_uint32(self, offset: int) -> int:
         """Read a uint32 (4 bytes) from shared memory."""
-        self._mmap.seek(offset)
-        return struct.unpack('I', self._mmap.read(4))[0]
+        return cast(int, _UINT32.unpack_from(self._mmap, offset)[0])
 
     def _read_string(self, offset: int, max_length: int) -> str:
-        """Read a null-terminated string from shared memory."""
-        self._mmap.seek(offset)
-        data = self._mmap.read(max_length)
+        """Read a null-terminated string from shared memory.
+
+        The strings rarely change between samples, so the last decoded value
+        is kept per offset and reused while the raw buffer is unchanged.
+        """
+        raw = self._mmap[offset:offset + max_length]
+        cached = self._strings.get(offset)
+        if cached is not None and cached[0] == raw:
+            return cached[1]
+
         # Find null terminator
-        null_pos = data.find(b'\x00')
-        if null_pos >= 0:
-            data = data[:null_pos]
-        return data.decode('utf-8', errors='replace')
-
-    def _read_vector3d(self, offset: int) -> Vector3D:
-        """Read a 3D vector (3 doubles) from shared memory."""
-        return Vector3D(
-            x=self._read_double(offset),
-            y=self._read_double(offset + 8),
-            z=self._read_double(offset + 16)
-        )
-
-    def read(self) -> FlightData:
+        null_pos = raw.find(b'\x00')
+        text = (raw[:null_pos] if null_pos >= 0 else raw).decode('utf-8', errors='replace')
+        self._strings[offset] = (raw, text)
+        return text
+
+    def read(self, force: bool = False) -> FlightData:
         """Read current flight data from shared memory.
 
+        If update_counter has not changed since the last complete frame, that
+        frame is returned again without decoding the mapping.
+
+        Args:
+            force: Decode the mapping even if update_counter is unchanged
+
         Returns:
             FlightData with the latest flight information
 
@@ -232,125 +268,123 @@ class SharedMemoryClient:
             raise NotConnectedError("Shared memory not open. Call connect() first.")
 
         try:
-            layout = self._layout
-
-            # Header
-            timestamp = self._read_uint64(layout.TIMESTAMP_OFFSET)
-            data_valid = self._read_uint32(layout.DATA_VALID_OFFSET) > 0
-            update_counter = self._read_uint32(layout.UPDATE_COUNTER_OFFSET)
-
-            # Position
-            position = Position(
-                latitude_rad=self._read_double(layout.LATITUDE_OFFSET),
-                longitude_rad=self._read_double(layout.LONGITUDE_OFFSET),
-                altitude_ft=self._read_double(layout.ALTITUDE_OFFSET),
-                height_agl_ft=self._read_double(layout.HEIGHT_OFFSET),
-            )
+            if not force:
+                # Polling faster than the simulator updates: nothing to decode
+                data_valid, update_counter = _HEADER.unpack_from(
+                    self._mmap, MemoryLayout.DATA_VALID_OFFSET
+                )
+                if (
+                    data_valid
+                    and update_counter == self._last_counter
+                    and self._last_frame is not None
+                ):
+                    return self._last_frame
 
-            # Speeds
-            speeds = Speeds(
-                indicated_airspeed_ms=self._read_double(layout.INDICATED_AIRSPEED_OFFSET),
-                ground_speed_ms=self._read_double(layout.GROUND_SPEED_OFFSET),
-                vertical_speed_ms=self._read_double(layout.VERTICAL_SPEED_OFFSET),
-                mach_number=self._read_double(layout.MACH_NUMBER_OFFSET),
-                angle_of_attack_rad=self._read_double(layout.ANGLE_OF_ATTACK_OFFSET),
-            )
-
-            # Orientation
-            orientation = Orientation(
-                pitch_rad=self._read_double(layout.PITCH_OFFSET),
-                bank_rad=self._read_double(layout.BANK_OFFSET),
-                true_heading_rad=self._read_double(layout.TRUE_HEADING_OFFSET),
-                magnetic_heading_rad=self._read_double(layout.MAGNETIC_HEADING_OFFSET),
-            )
-
-            # State
-            on_ground = self._read_double(layout.ON_GROUND_OFFSET) > 0.5
-            gear = self._read_double(layout.GEAR_OFFSET)
-            flaps = self._read_double(layout.FLAPS_OFFSET)
-            throttle = self._read_double(layout.THROTTLE_OFFSET)
-            parking_brake = self._read_double(layout.PARKING_BRAKE_OFFSET) > 0.5
-
-            # Engines
-            engines = Engines(
-                engine1=EngineState(
-                    running=self._read_double(layout.ENGINE_RUNNING_1_OFFSET) > 0.5,
-                    throttle=self._read_double(layout.ENGINE_THROTTLE_1_OFFSET),
-                ),
-                engine2=EngineState(
-                    running=self._read_double(layout.ENGINE_RUNNING_2_OFFSET) > 0.5,
-                    throttle=self._read_double(layout.ENGINE_THROTTLE_2_OFFSET),
-                ),
-            )
-
-            # Navigation
-            navigation = Navigation(
-                nav1_frequency=self._read_double(layout.NAV1_FREQUENCY_OFFSET),
-                nav2_frequency=self._read_double(layout.NAV2_FREQUENCY_OFFSET),
-                com1_frequency=self._read_double(layout.COM1_FREQUENCY_OFFSET),
-                com2_frequency=self._read_double(layout.COM2_FREQUENCY_OFFSET),
-                selected_course_1_rad=self._read_double(layout.SELECTED_COURSE_1_OFFSET),
-                selected_course_2_rad=self._read_double(layout.SELECTED_COURSE_2_OFFSET),
-            )
-
-            # Autopilot
-            autopilot = Autopilot(
-                master=self._read_double(layout.AUTOPILOT_MASTER_OFFSET) > 0.5,
-                heading_rad=self._read_double(layout.AUTOPILOT_HEADING_OFFSET),
-                altitude_ft=self._read_double(layout.AUTOPILOT_ALTITUDE_OFFSET),
-                vertical_speed_fpm=self._read_double(layout.AUTOPILOT_VS_OFFSET),
-            )
-
-            # V-Speeds
-            vspeeds = VSpeeds(
-                vs0_ms=self._read_double(layout.VS0_OFFSET),
-                vs1_ms=self._read_double(layout.VS1_OFFSET),
-                vfe_ms=self._read_double(layout.VFE_OFFSET),
-                vno_ms=self._read_double(layout.VNO_OFFSET),
-                vne_ms=self._read_double(layout.VNE_OFFSET),
-            )
-
-            # Physics vectors
-            world_position = self._read_vector3d(layout.POSITION_OFFSET)
-            velocity = self._read_vector3d(layout.VELOCITY_OFFSET)
-            acceleration = self._read_vector3d(layout.ACCELERATION_OFFSET)
-            wind = self._read_vector3d(layout.WIND_OFFSET)
-
-            # Aircraft info
-            aircraft = AircraftInfo(
-                name=self._read_string(layout.AIRCRAFT_NAME_OFFSET, 64),
-                nearest_airport_id=self._read_string(layout.NEAREST_AIRPORT_ID_OFFSET, 8),
-                nearest_airport_name=self._read_string(layout.NEAREST_AIRPORT_NAME_OFFSET, 64),
-                nearest_airport_elevation_ft=self._read_double(layout.NEAREST_AIRPORT_ELEVATION_OFFSET),
-                nearest_airport_latitude_rad=self._read_double(layout.NEAREST_AIRPORT_LATITUDE_OFFSET),
-                nearest_airport_longitude_rad=self._read_double(layout.NEAREST_AIRPORT_LONGITUDE_OFFSET),
-            )
+            layout = self._layout
 
-            return FlightData(
-                timestamp=timestamp,
-                update_counter=update_counter,
-                data_valid=data_valid,
-                update_hz=0.0,  # Not available in shared memory
-                schema='aerofly-reader-telemetry',
-                version='1.1.0',
-                position=position,
-                speeds=speeds,
-                orientation=orientation,
-                on_ground=on_ground,
-                gear=gear,
-                flaps=flaps,
-                throttle=throttle,
-                parking_brake=parking_brake,
-                engines=engines,
-                autopilot=autopilot,
-                navigation=navigation,
-                vspeeds=vspeeds,
-                world_position=world_position,
-                velocity=velocity,
-                acceleration=acceleration,
-                wind=wind,
-                aircraft=aircraft,
-            )
+            # Decode the whole numeric block in one pass; the field order
+            # follows the offsets in MemoryLayout
+            (
+                timestamp, data_valid, update_counter,
+                lat, lon, alt, height, pitch, bank, true_hdg, mag_hdg,
+                ias, gs, vs, mach, aoa,
+                on_gnd, gear, flaps, throttle, brake,
+                eng_run_1, eng_run_2, eng_thr_1, eng_thr_2,
+                nav1, nav2, com1, com2, crs1, crs2,
+                ap_master, ap_hdg, ap_alt, ap_vs,
+                vs0, vs1, vfe, vno, vne,
+                pos_x, pos_y, pos_z, vel_x, vel_y, vel_z,
+                acc_x, acc_y, acc_z, wind_x, wind_y, wind_z,
+                apt_elev, apt_lat, apt_lon,
+            ) = _NUMERIC.unpack_from(self._mmap, 0)
+
+            aircraft_name = self._read_string(layout.AIRCRAFT_NAME_OFFSET, 64)
+            airport_id = self._read_string(layout.NEAREST_AIRPORT_ID_OFFSET, 8)
+            airport_name = self._read_string(layout.NEAREST_AIRPORT_NAME_OFFSET, 64)
+
+            frame = self._frame
+            if frame is not None:
+                # reuse_frame: overwrite the one frame in place (the models
+                # are frozen, so this goes through object.__setattr__)
+                set_ = object.__setattr__
+                set_(frame, 'timestamp', timestamp)
+                set_(frame, 'update_counter', update_counter)
+                set_(frame, 'data_valid', data_valid > 0)
+                set_(frame, 'on_ground', on_gnd > 0.5)
+                set_(frame, 'gear', gear)
+                set_(frame, 'flaps', flaps)
+                set_(frame, 'throttle', throttle)
+                set_(frame, 'parking_brake', brake > 0.5)
+
+                for obj, values in (
+                    (frame.position, (lat, lon, alt, height)),
+                    (frame.speeds, (ias, gs, vs, mach, aoa)),
+                    (frame.orientation, (pitch, bank, true_hdg, mag_hdg)),
+                    (frame.engines.engine1, (eng_run_1 > 0.5, eng_thr_1)),
+                    (frame.engines.engine2, (eng_run_2 > 0.5, eng_thr_2)),
+                    (frame.navigation, (nav1, nav2, com1, com2, crs1, crs2)),
+                    (frame.autopilot, (ap_master > 0.5, ap_hdg, ap_alt, ap_vs)),
+                    (frame.vspeeds, (vs0, vs1, vfe, vno, vne)),
+                    (frame.world_position, (pos_x, pos_y, pos_z)),
+                    (frame.velocity, (vel_x, vel_y, vel_z)),
+                    (frame.acceleration, (acc_x, acc_y, acc_z)),
+                    (frame.wind, (wind_x, wind_y, wind_z)),
+                    (frame.aircraft, (
+                        aircraft_name, airport_id, airport_name, apt_elev, apt_lat, apt_lon,
+                    )),
+                ):
+                    # Slots are declared in field order
+                    for name, value in zip(obj.__slots__, values):
+                        set_(obj, name, value)
+            else:
+                position = Position(lat, lon, alt, height)
+                speeds = Speeds(ias, gs, vs, mach, aoa)
+                orientation = Orientation(pitch, bank, true_hdg, mag_hdg)
+
+                engines = Engines(
+                    EngineState(eng_run_1 > 0.5, eng_thr_1),
+                    EngineState(eng_run_2 > 0.5, eng_thr_2),
+                )
+                navigation = Navigation(nav1, nav2, com1, com2, crs1, crs2)
+                autopilot = Autopilot(ap_master > 0.5, ap_hdg, ap_alt, ap_vs)
+                vspeeds = VSpeeds(vs0, vs1, vfe, vno, vne)
+
+                # Aircraft info
+                aircraft = AircraftInfo(
+                    aircraft_name, airport_id, airport_name, apt_elev, apt_lat, apt_lon,
+                )
+
+                frame = FlightData(
+                    timestamp=timestamp,
+                    update_counter=update_counter,
+                    data_valid=data_valid > 0,
+                    update_hz=0.0,  # Not available in shared memory
+                    schema='aerofly-reader-telemetry',
+                    version='1.1.0',
+                    position=position,
+                    speeds=speeds,
+                    orientation=orientation,
+                    on_ground=on_gnd > 0.5,
+                    gear=gear,
+                    flaps=flaps,
+                    throttle=throttle,
+                    parking_brake=brake > 0.5,
+                    engines=engines,
+                    autopilot=autopilot,
+                    navigation=navigation,
+                    vspeeds=vspeeds,
+                    world_position=Vector3D(pos_x, pos_y, pos_z),
+                    velocity=Vector3D(vel_x, vel_y, vel_z),
+                    acceleration=Vector3D(acc_x, acc_y, acc_z),
+                    wind=Vector3D(wind_x, wind_y, wind_z),
+                    aircraft=aircraft,
+                )
+
+            # Only complete frames are reused; the DLL clears data_valid while
+            # it writes and bumps update_counter before setting it again
+            self._last_counter = update_counter if data_valid else None
+            self._last_frame = frame
+            return frame
 
         except Exception as e:
             raise SharedMemoryError(f"Failed to read shared memory: {e}")
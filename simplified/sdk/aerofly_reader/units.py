@@ -2,9 +2,14 @@
 Aerofly Reader SDK - Unit Conversions
 
 Provides conversion functions between simulator units and standard aviation units.
+
+The conversion functions only use arithmetic operators, so besides floats
+they also accept NumPy arrays (or anything else that supports them) and
+convert a whole column of samples in one call.
 """
 
 import math
+from functools import lru_cache
 
 # Conversion constants
 MS_TO_KNOTS = 1.94384
@@ -14,6 +19,8 @@ FEET_TO_METERS = 0.3048
 METERS_TO_FEET = 3.28084
 NM_TO_METERS = 1852.0
 METERS_TO_NM = 1 / NM_TO_METERS
+RAD_TO_DEG = 180.0 / math.pi
+DEG_TO_RAD = math.pi / 180.0
 
 
 def ms_to_knots(ms: float) -> float:
@@ -85,7 +92,7 @@ def radians_to_degrees(rad: float) -> float:
     Returns:
         Angle in degrees
     """
-    return math.degrees(rad)
+    return rad * RAD_TO_DEG
 
 
 def degrees_to_radians(deg: float) -> float:
@@ -97,7 +104,7 @@ def degrees_to_radians(deg: float) -> float:
     Returns:
         Angle in radians
     """
-    return math.radians(deg)
+    return deg * DEG_TO_RAD
 
 
 def normalize_heading(degrees: float) -> float:
@@ -124,9 +131,9 @@ def normalize_longitude(degrees: float) -> float:
     Returns:
         Longitude in degrees (-180 to +180)
     """
-    if degrees > 180:
-        return degrees - 360
-    return degrees
+    # Branch-free form of "if degrees > 180: degrees -= 360", which also
+    # works element-wise on arrays
+    return degrees - 360.0 * (degrees > 180)
 
 
 def feet_to_meters(feet: float) -> float:
@@ -153,6 +160,32 @@ def meters_to_feet(meters: float) -> float:
     return meters * METERS_TO_FEET
 
 
+# The formatters print whole numbers, so each one rounds its input and
+# caches the string per integer: displays redrawn at tens of Hz mostly see
+# the same few values. NaN and infinity cannot be rounded and are formatted
+# directly.
+
+@lru_cache(maxsize=512)
+def _format_heading(degrees: int) -> str:
+    return f"{degrees:03d}°"
+
+
+@lru_cache(maxsize=1024)
+def _format_altitude(feet: int) -> str:
+    return f"{feet:,} ft"
+
+
+@lru_cache(maxsize=1024)
+def _format_speed_kts(knots: int) -> str:
+    return f"{knots} kts"
+
+
+@lru_cache(maxsize=1024)
+def _format_vertical_speed(fpm: int, climbing: bool) -> str:
+    sign = "+" if climbing else ""
+    return f"{sign}{fpm} fpm"
+
+
 def format_heading(radians: float) -> str:
     """Format heading as 3-digit string with degree symbol.
 
@@ -162,8 +195,11 @@ def format_heading(radians: float) -> str:
     Returns:
         Formatted heading (e.g., "045°", "270°")
     """
-    degrees = normalize_heading(radians_to_degrees(radians))
-    return f"{degrees:03.0f}°"
+    degrees = radians * RAD_TO_DEG % 360
+    try:
+        return _format_heading(round(degrees))
+    except (ValueError, OverflowError):
+        return f"{degrees:03.0f}°"
 
 
 def format_altitude(feet: float) -> str:
@@ -175,7 +211,10 @@ def format_altitude(feet: float) -> str:
     Returns:
         Formatted altitude (e.g., "10,500 ft")
     """
-    return f"{feet:,.0f} ft"
+    try:
+        return _format_altitude(round(feet))
+    except (ValueError, OverflowError):
+        return f"{feet:,.0f} ft"
 
 
 def format_speed_kts(ms: float) -> str:
@@ -187,7 +226,11 @@ def format_speed_kts(ms: float) -> str:
     Returns:
         Formatted speed (e.g., "250 kts")
     """
-    return f"{ms_to_knots(ms):.0f} kts"
+    knots = ms * MS_TO_KNOTS
+    try:
+        return _format_speed_kts(round(knots))
+    except (ValueError, OverflowError):
+        return f"{knots:.0f} kts"
 
 
 def format_vertical_speed(ms: float) -> str:
@@ -199,6 +242,9 @@ def format_vertical_speed(ms: float) -> str:
     Returns:
         Formatted vertical speed (e.g., "+500 fpm", "-1200 fpm")
     """
-    fpm = ms_to_fpm(ms)
-    sign = "+" if fpm > 0 else ""
-    return f"{sign}{fpm:.0f} fpm"
+    fpm = ms * MS_TO_FPM
+    try:
+        return _format_vertical_speed(round(fpm), fpm > 0)
+    except (ValueError, OverflowError):
+        sign = "+" if fpm > 0 else ""
+        return f"{sign}{fpm:.0f} fpm"
@@ -6,43 +6,51 @@ Demonstrates async/await usage with the SDK.
 """
 
 import asyncio
+import sys
 
 from aerofly_reader import AsyncAeroflyClient
 
+# Minimum time between screen redraws (seconds)
+REFRESH_INTERVAL = 0.1
+
 
 async def display_flight_data(flight):
     """Display flight data asynchronously."""
-    print("\033[H\033[J", end="")  # Clear screen
+    out = []
 
-    print("=" * 50)
-    print("    ASYNC FLIGHT MONITOR")
-    print("=" * 50)
+    out.append("=" * 50)
+    out.append("    ASYNC FLIGHT MONITOR")
+    out.append("=" * 50)
 
-    print(f"\n  Aircraft: {flight.aircraft_name}")
+    out.append(f"\n  Aircraft: {flight.aircraft_name}")
 
     # Position
-    print(f"\n  Position: {flight.position.latitude:.4f}°, {flight.position.longitude:.4f}°")
-    print(f"  Altitude: {flight.position.altitude_ft:,.0f} ft")
+    out.append(f"\n  Position: {flight.position.latitude:.4f}°, {flight.position.longitude:.4f}°")
+    out.append(f"  Altitude: {flight.position.altitude_ft:,.0f} ft")
 
     # Speeds
-    print(f"\n  IAS: {flight.speeds.ias:.0f} kts")
-    print(f"  GS:  {flight.speeds.gs:.0f} kts")
-    print(f"  VS:  {flight.speeds.vs:+.0f} fpm")
+    out.append(f"\n  IAS: {flight.speeds.ias:.0f} kts")
+    out.append(f"  GS:  {flight.speeds.gs:.0f} kts")
+    out.append(f"  VS:  {flight.speeds.vs:+.0f} fpm")
 
     # Status
     status = "ON GROUND" if flight.on_ground else "AIRBORNE"
-    print(f"\n  Status: {status}")
-    print(f"  Heading: {flight.orientation.heading:03.0f}°")
+    out.append(f"\n  Status: {status}")
+    out.append(f"  Heading: {flight.orientation.heading:03.0f}°")
 
     # Autopilot
     if flight.autopilot.master:
-        print(f"\n  AP: ON")
-        print(f"    HDG: {flight.autopilot.heading:03.0f}°")
-        print(f"    ALT: {flight.autopilot.altitude:,.0f} ft")
+        out.append(f"\n  AP: ON")
+        out.append(f"    HDG: {flight.autopilot.heading:03.0f}°")
+        out.append(f"    ALT: {flight.autopilot.altitude:,.0f} ft")
+
+    out.append("\n" + "-" * 50)
+    out.append(f"  Update: {flight.update_counter} @ {flight.update_hz:.1f} Hz")
+    out.append("  Press Ctrl+C to exit")
 
-    print("\n" + "-" * 50)
-    print(f"  Update: {flight.update_counter} @ {flight.update_hz:.1f} Hz")
-    print("  Press Ctrl+C to exit")
+    # One write per frame; the leading escape sequence clears the screen
+    sys.stdout.write("\033[H\033[J" + "\n".join(out) + "\n")
+    sys.stdout.flush()
 
 
 async def main():
@@ -51,10 +59,26 @@ async def main():
 
     try:
         async with AsyncAeroflyClient() as client:
-            async for flight in client.stream():
-                await display_flight_data(flight)
-                # Small delay to reduce CPU usage
-                await asyncio.sleep(0.1)
+            latest = None
+            arrived = asyncio.Event()
+
+            async def redraw():
+                # Draw the newest frame at most every REFRESH_INTERVAL; frames
+                # arriving in between only replace it, so the one drawn when
+                # the interval ends is never older than the last received
+                while True:
+                    await arrived.wait()
+                    arrived.clear()
+                    await display_flight_data(latest)
+                    await asyncio.sleep(REFRESH_INTERVAL)
+
+            drawer = asyncio.ensure_future(redraw())
+            try:
+                async for flight in client.stream():
+                    latest = flight
+                    arrived.set()
+            finally:
+                drawer.cancel()
 
     except KeyboardInterrupt:
         print("\n\nExiting...")
@@ -5,6 +5,8 @@ Aerofly Reader SDK - Basic Usage Example
 Demonstrates the simplest way to connect and read flight data.
 """
 
+import sys
+
 from aerofly_reader import stream
 
 
@@ -16,50 +18,53 @@ def main():
 
     try:
         for flight in stream():
-            # Clear screen
-            print("\033[H\033[J", end="")
+            out = []
 
-            print("=" * 50)
-            print("        FLIGHT DATA")
-            print("=" * 50)
+            out.append("=" * 50)
+            out.append("        FLIGHT DATA")
+            out.append("=" * 50)
 
             # Aircraft info
-            print(f"\n  Aircraft: {flight.aircraft_name}")
-            print(f"  Near: {flight.aircraft.nearest_airport_id}")
+            out.append(f"\n  Aircraft: {flight.aircraft_name}")
+            out.append(f"  Near: {flight.aircraft.nearest_airport_id}")
 
             # Position (automatically converted to degrees)
-            print(f"\n  POSITION")
-            print(f"    Lat: {flight.position.latitude:+.6f}°")
-            print(f"    Lon: {flight.position.longitude:+.6f}°")
-            print(f"    Alt: {flight.position.altitude_ft:,.0f} ft MSL")
-            print(f"    AGL: {flight.position.height_agl_ft:,.0f} ft")
+            out.append(f"\n  POSITION")
+            out.append(f"    Lat: {flight.position.latitude:+.6f}°")
+            out.append(f"    Lon: {flight.position.longitude:+.6f}°")
+            out.append(f"    Alt: {flight.position.altitude_ft:,.0f} ft MSL")
+            out.append(f"    AGL: {flight.position.height_agl_ft:,.0f} ft")
 
             # Speeds (automatically converted to knots/fpm)
-            print(f"\n  SPEEDS")
-            print(f"    IAS: {flight.speeds.indicated_airspeed:.0f} kts")
-            print(f"    GS:  {flight.speeds.ground_speed:.0f} kts")
-            print(f"    VS:  {flight.speeds.vertical_speed:+.0f} fpm")
-            print(f"    Mach: {flight.speeds.mach_number:.3f}")
+            out.append(f"\n  SPEEDS")
+            out.append(f"    IAS: {flight.speeds.indicated_airspeed:.0f} kts")
+            out.append(f"    GS:  {flight.speeds.ground_speed:.0f} kts")
+            out.append(f"    VS:  {flight.speeds.vertical_speed:+.0f} fpm")
+            out.append(f"    Mach: {flight.speeds.mach_number:.3f}")
 
             # Orientation (automatically converted to degrees)
-            print(f"\n  ORIENTATION")
-            print(f"    Heading: {flight.orientation.heading:03.0f}°")
-            print(f"    Pitch:   {flight.orientation.pitch:+.1f}°")
-            print(f"    Bank:    {flight.orientation.bank:+.1f}°")
+            out.append(f"\n  ORIENTATION")
+            out.append(f"    Heading: {flight.orientation.heading:03.0f}°")
+            out.append(f"    Pitch:   {flight.orientation.pitch:+.1f}°")
+            out.append(f"    Bank:    {flight.orientation.bank:+.1f}°")
 
             # State
             status = "ON GROUND" if flight.on_ground else "IN FLIGHT"
-            print(f"\n  STATE: {status}")
-            print(f"    Gear:     {flight.gear_percent:.0f}%")
-            print(f"    Flaps:    {flight.flaps_percent:.0f}%")
-            print(f"    Throttle: {flight.throttle_percent:.0f}%")
+            out.append(f"\n  STATE: {status}")
+            out.append(f"    Gear:     {flight.gear_percent:.0f}%")
+            out.append(f"    Flaps:    {flight.flaps_percent:.0f}%")
+            out.append(f"    Throttle: {flight.throttle_percent:.0f}%")
 
             # Footer
-            print("\n" + "-" * 50)
+            out.append("\n" + "-" * 50)
             valid = "✓" if flight.data_valid else "✗"
-            print(f"  Update #{flight.update_counter} | Valid: {valid}")
-            print("  Press Ctrl+C to exit")
-            print("=" * 50)
+            out.append(f"  Update #{flight.update_counter} | Valid: {valid}")
+            out.append("  Press Ctrl+C to exit")
+            out.append("=" * 50)
+
+            # One write per frame; the leading escape sequence clears the screen
+            sys.stdout.write("\033[H\033[J" + "\n".join(out) + "\n")
+            sys.stdout.flush()
 
     except KeyboardInterrupt:
         print("\n\nExiting...")
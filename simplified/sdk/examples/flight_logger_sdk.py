@@ -37,34 +37,44 @@ CSV_COLUMNS = [
     'nearest_airport',
 ]
 
+# Column name -> position in a row tuple
+_FIELD_INDEX = {name: i for i, name in enumerate(CSV_COLUMNS)}
 
-def flight_to_row(flight: FlightData, start_time: float) -> dict:
-    """Convert FlightData to CSV row using SDK properties."""
-    return {
-        'timestamp': datetime.now().isoformat(),
-        'elapsed_seconds': round(time.time() - start_time, 2),
+# Rows buffered before each write + flush (one minute at the default interval)
+FLUSH_ROWS = 60
+
+
+def flight_to_row(flight: FlightData, elapsed: float, now: float) -> tuple:
+    """Convert FlightData to a CSV row (tuple in CSV_COLUMNS order) using SDK properties.
+
+    elapsed is measured on the monotonic clock; now is the wall-clock
+    time.time() used for the timestamp column.
+    """
+    return (
+        datetime.fromtimestamp(now).isoformat(),
+        round(elapsed, 2),
         # Position - SDK auto-converts radians to degrees
-        'latitude': round(flight.position.latitude, 6),
-        'longitude': round(flight.position.longitude, 6),
-        'altitude_ft': round(flight.position.altitude_ft, 1),
-        'height_agl_ft': round(flight.position.height_agl_ft, 1),
+        round(flight.position.latitude, 6),
+        round(flight.position.longitude, 6),
+        round(flight.position.altitude_ft, 1),
+        round(flight.position.height_agl_ft, 1),
         # Speeds - SDK auto-converts m/s to knots/fpm
-        'ias_kts': round(flight.speeds.indicated_airspeed, 1),
-        'gs_kts': round(flight.speeds.ground_speed, 1),
-        'vs_fpm': round(flight.speeds.vertical_speed, 0),
+        round(flight.speeds.indicated_airspeed, 1),
+        round(flight.speeds.ground_speed, 1),
+        round(flight.speeds.vertical_speed, 0),
         # Orientation - SDK auto-converts radians to degrees
-        'heading': round(flight.orientation.heading, 1),
-        'pitch': round(flight.orientation.pitch, 2),
-        'bank': round(flight.orientation.bank, 2),
+        round(flight.orientation.heading, 1),
+        round(flight.orientation.pitch, 2),
+        round(flight.orientation.bank, 2),
         # State - SDK provides boolean properties
-        'on_ground': 1 if flight.on_ground else 0,
-        'gear': round(flight.gear, 2),
-        'flaps': round(flight.flaps, 2),
-        'throttle': round(flight.throttle, 2),
+        1 if flight.on_ground else 0,
+        round(flight.gear, 2),
+        round(flight.flaps, 2),
+        round(flight.throttle, 2),
         # Info
-        'aircraft': flight.aircraft_name,
-        'nearest_airport': flight.aircraft.nearest_airport_id,
-    }
+        flight.aircraft_name,
+        flight.aircraft.nearest_airport_id,
+    )
 
 
 def main():
@@ -81,48 +91,58 @@ def main():
     filepath = Path(filename)
     print(f"Log file: {filepath.absolute()}\n")
 
-    start_time = time.time()
+    # Intervals and elapsed time use the monotonic clock, which clock
+    # adjustments cannot move; the wall clock is only read per record
+    start_time = time.monotonic()
     record_count = 0
     log_interval = 1.0  # Record every second
 
     # Open CSV and connect to Aerofly
     with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=CSV_COLUMNS)
-        writer.writeheader()
+        writer = csv.writer(csvfile)
+        writer.writerow(CSV_COLUMNS)
 
         print("Recording... (Ctrl+C to stop)\n")
 
+        # Rows are written and flushed in batches; the tail is written on exit
+        pending = []
+
         # Use SDK client with context manager
         with AeroflyClient() as client:
-            last_log_time = 0
+            last_log_time = float('-inf')
 
             try:
                 for flight in client.stream():
-                    current_time = time.time()
+                    current_time = time.monotonic()
 
                     # Record at interval
                     if current_time - last_log_time >= log_interval:
-                        row = flight_to_row(flight, start_time)
-                        writer.writerow(row)
-                        csvfile.flush()
+                        row = flight_to_row(flight, current_time - start_time, time.time())
+                        pending.append(row)
+                        if len(pending) >= FLUSH_ROWS:
+                            writer.writerows(pending)
+                            csvfile.flush()
+                            pending.clear()
 
                         record_count += 1
                         last_log_time = current_time
 
                         # Show progress
-                        elapsed = row['elapsed_seconds']
-                        alt = row['altitude_ft']
-                        spd = row['ias_kts']
-                        apt = row['nearest_airport']
+                        elapsed = row[_FIELD_INDEX['elapsed_seconds']]
+                        alt = row[_FIELD_INDEX['altitude_ft']]
+                        spd = row[_FIELD_INDEX['ias_kts']]
+                        apt = row[_FIELD_INDEX['nearest_airport']]
                         print(f"\r[{elapsed:>7.1f}s] Alt: {alt:>6.0f} ft | "
                               f"IAS: {spd:>5.0f} kts | Near: {apt} | "
                               f"Records: {record_count}", end="")
 
             except KeyboardInterrupt:
                 print("\n\nStopping...")
+            finally:
+                writer.writerows(pending)
 
     # Summary
-    duration = time.time() - start_time
+    duration = time.monotonic() - start_time
     print("\n" + "=" * 50)
     print(f"Recording complete!")
     print(f"  File: {filepath.absolute()}")